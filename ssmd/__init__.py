@@ -68,6 +68,7 @@ from ssmd.frontmatter import (
 )
 from ssmd.paragraph import Paragraph
 from ssmd.parser import (
+    iter_sentences,
     iter_sentences_spans,
     lint,
     parse_paragraphs,
@@ -210,6 +211,7 @@ __all__ = [
     "parse_paragraphs",
     "parse_ssmd",
     "parse_sentences",
+    "iter_sentences",
     "parse_segments",
     "parse_voice_blocks",
     "extract_voice_references",
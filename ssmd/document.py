@@ -124,6 +124,7 @@ class Document:
         self._capabilities = capabilities
         self._capabilities_obj: TTSCapabilities | None = None  # Resolved capabilities
         self._cached_ssml: str | None = None
+        self._cached_ssmd: str | None = None
         self._cached_sentences: list[str] | None = None
         self._cached_paragraphs: list[Paragraph] | None = None
         self._escape_syntax = escape_syntax
@@ -432,13 +433,16 @@ class Document:
         if not raw_ssmd.strip():
             return self.source if include_header and self.header is not None else raw_ssmd
 
-        # Parse into sentences and format with proper line breaks
-        sentences = self._parse_sentence_objects()
-        formatted = format_ssmd(sentences).rstrip("\n")
-        if self._escape_syntax:
-            from ssmd.utils import unescape_ssmd_syntax
+        if self._cached_ssmd is None:
+            # Parse into sentences and format with proper line breaks
+            sentences = self._parse_sentence_objects()
+            formatted = format_ssmd(sentences).rstrip("\n")
+            if self._escape_syntax:
+                from ssmd.utils import unescape_ssmd_syntax
 
-            formatted = unescape_ssmd_syntax(formatted)
+                formatted = unescape_ssmd_syntax(formatted)
+            self._cached_ssmd = formatted
+        formatted = self._cached_ssmd
         if include_header and self.header is not None:
             return serialize_front_matter(self.header, formatted)
         return formatted
@@ -1137,8 +1141,9 @@ class Document:
         return f" {attrs}"
 
     def _invalidate_cache(self) -> None:
-        """Invalidate cached SSML and sentences."""
+        """Invalidate cached SSML, SSMD, and sentences."""
         self._cached_ssml = None
+        self._cached_ssmd = None
         self._cached_sentences = None
         self._cached_paragraphs = None
         self.sentence_detection_diagnostics = None
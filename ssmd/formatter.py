@@ -5,9 +5,12 @@ line breaks, paragraph spacing, and structural elements according to SSMD
 formatting conventions.
 """
 
+import io
+import re
 from dataclasses import replace
+from functools import lru_cache
 
-from ssmd.segment import Segment
+from ssmd.segment import Segment, _escape_xml_attr
 from ssmd.sentence import Sentence
 from ssmd.ssml_conversions import SSMD_BREAK_STRENGTH_MAP
 from ssmd.types import BreakAttrs, ProsodyAttrs, VoiceAttrs
@@ -16,6 +19,9 @@ from ssmd.types import BreakAttrs, ProsodyAttrs, VoiceAttrs
 SSMDSentence = Sentence
 SSMDSegment = Segment
 
+# Break marker at the end of a line: ... followed by a strength letter or a time
+_TRAILING_BREAK_MARKER_PATTERN = re.compile(r"\.\.\.(?:[swcpn]|\d+(?:ms|s))$")
+
 
 def format_source(text: str) -> str:
     """Apply the safe, source-preserving formatter contract.
@@ -59,7 +65,7 @@ def format_ssmd(sentences: list[Sentence]) -> str:
     if not sentences:
         return ""
 
-    output_lines: list[str] = []
+    writer = _LineWriter()
     previous_directive: tuple[VoiceAttrs | None, str | None, ProsodyAttrs | None] = (
         None,
         None,
@@ -68,17 +74,16 @@ def format_ssmd(sentences: list[Sentence]) -> str:
 
     for i, sentence in enumerate(sentences):
         directive_key = (sentence.voice, sentence.language, sentence.prosody)
-        if directive_key != previous_directive:
+        if not _same_directive(directive_key, previous_directive):
             if previous_directive != (None, None, None):
-                output_lines.append("</div>")
-                output_lines.append("")
+                writer.line("</div>")
+                writer.blank()
 
             if any(directive_key):
                 directive = _format_div_directive(sentence)
                 if directive:
-                    if output_lines and output_lines[-1] != "":
-                        output_lines.append("")
-                    output_lines.append(directive)
+                    writer.blank()
+                    writer.line(directive)
             previous_directive = directive_key
 
         # Check if sentence has breaks_before (from previous sentence boundary)
@@ -86,9 +91,9 @@ def format_ssmd(sentences: list[Sentence]) -> str:
         # rendering the current sentence so they are emitted exactly once.
         leading_breaks_moved = False
         if i > 0 and sentence.segments and sentence.segments[0].breaks_before:
-            if output_lines:
+            if writer.has_output:
                 break_marker = _format_breaks(sentence.segments[0].breaks_before)
-                output_lines[-1] += " " + break_marker
+                writer.append_to_line(break_marker)
                 leading_breaks_moved = True
 
         # Format the sentence using to_ssmd()
@@ -97,28 +102,89 @@ def format_ssmd(sentences: list[Sentence]) -> str:
         )
 
         if sentence_text:
-            output_lines.append(sentence_text)
+            writer.line(sentence_text)
 
             # Add paragraph break if needed
             if sentence.is_paragraph_end:
-                output_lines.append("")  # Extra blank line for paragraph
+                writer.blank()
 
     if previous_directive != (None, None, None):
-        if output_lines and output_lines[-1] != "":
-            output_lines.append("")
-        output_lines.append("</div>")
-        output_lines.append("")
-
-    # Join lines and ensure trailing newline
-    result = "\n".join(output_lines)
+        writer.blank()
+        writer.line("</div>")
 
-    # Clean up multiple consecutive blank lines (max 1 blank line)
-    while "\n\n\n" in result:
-        result = result.replace("\n\n\n", "\n\n")
+    # Blank lines are never emitted twice in a row, so no post-hoc collapsing
+    # pass is needed; only the trailing newline is normalized.
+    result = writer.getvalue()
 
     return result.rstrip() + "\n" if result else ""
 
 
+def _same_directive(
+    key: tuple[VoiceAttrs | None, str | None, ProsodyAttrs | None],
+    previous: tuple[VoiceAttrs | None, str | None, ProsodyAttrs | None],
+) -> bool:
+    """Return True if two directive keys describe the same <div> wrapper.
+
+    Sentences parsed from one directive block share the same attribute
+    objects, so identity settles the common case before any field-wise
+    dataclass comparison.
+    """
+    if key[0] is previous[0] and key[1] is previous[1] and key[2] is previous[2]:
+        return True
+    return key == previous
+
+
+class _LineWriter:
+    """Stream formatted SSMD lines into a single text buffer.
+
+    The most recent line is kept open as a list of fragments so that a
+    sentence-boundary break can still be appended to it; every earlier line is
+    written to the buffer exactly once.
+    """
+
+    __slots__ = ("_buffer", "_line", "_started")
+
+    def __init__(self) -> None:
+        self._buffer = io.StringIO()
+        self._line: list[str] | None = None
+        self._started = False
+
+    @property
+    def has_output(self) -> bool:
+        """Return True once any line (including a blank one) was emitted."""
+        return self._line is not None
+
+    def line(self, text: str) -> None:
+        """Start a new line containing ``text``."""
+        self._flush()
+        self._line = [text]
+
+    def blank(self) -> None:
+        """Emit a blank separator unless the output is empty or already blank."""
+        if self._line:
+            self._flush()
+            self._line = []
+
+    def append_to_line(self, fragment: str) -> None:
+        """Append a space-separated fragment to the open line."""
+        if self._line is not None:
+            self._line.append(fragment)
+
+    def getvalue(self) -> str:
+        """Return everything written so far, including the open line."""
+        self._flush()
+        self._line = None
+        return self._buffer.getvalue()
+
+    def _flush(self) -> None:
+        if self._line is None:
+            return
+        if self._started:
+            self._buffer.write("\n")
+        self._buffer.write(" ".join(self._line))
+        self._started = True
+
+
 def _format_sentence_content(sentence: Sentence, *, suppress_leading_breaks: bool = False) -> str:
     """Format a single sentence's content (segments only).
 
@@ -131,8 +197,10 @@ def _format_sentence_content(sentence: Sentence, *, suppress_leading_breaks: boo
     if not sentence.segments:
         return ""
 
-    # Build segments using their to_ssmd() method
-    result_parts: list[str] = []
+    # Build the line in one pass: each rendered segment is appended together
+    # with the separator it needs, and the pieces are joined once at the end.
+    pieces: list[str] = []
+    previous = ""
 
     for segment_index, segment in enumerate(sentence.segments):
         # A sentence-boundary break may already have been moved to the previous
@@ -141,53 +209,69 @@ def _format_sentence_content(sentence: Sentence, *, suppress_leading_breaks: boo
         if suppress_leading_breaks and segment_index == 0 and segment.breaks_before:
             render_segment = replace(segment, breaks_before=[])
 
-        # Format the segment using its to_ssmd() method
-        segment_text = render_segment.to_ssmd()
+        segment_text = _format_segment(render_segment)
 
-        # Preserve the trailing space if segment has breaks_after
+        # Preserve the trailing space if segment has breaks_after. Segment text
+        # keeps its source whitespace, so it is trimmed here exactly once.
         if segment.breaks_after:
-            segment_text = segment_text.rstrip() + " "
+            segment_text = segment_text.rstrip()
+            if not segment_text:
+                continue
+            segment_text += " "
         else:
             segment_text = segment_text.strip()
-
-        if not segment_text.strip():
-            continue
-
-        # Add this segment
-        result_parts.append(segment_text)
-
-    # Join segments intelligently
-    sentence_text = ""
-    for i, part in enumerate(result_parts):
-        if i == 0:
-            sentence_text = part
-        elif part.startswith("..."):
-            # This is a break marker - append without extra space
-            sentence_text += part
-        elif i > 0 and _ends_with_break_marker(result_parts[i - 1]):
-            # Previous part ends with break marker, already has space
-            sentence_text += part
-        elif i > 0 and result_parts[i - 1].endswith((" ", "\n")):
-            # Previous part ends with whitespace
-            sentence_text += part
-        else:
-            # Normal text segment - add space
-            sentence_text += " " + part
+            if not segment_text:
+                continue
+
+        # Separate segments with a space unless this one is a break marker or
+        # the previous one already ends with whitespace or a break marker
+        if previous and not (
+            segment_text.startswith("...")
+            or previous.endswith((" ", "\n"))
+            or _ends_with_break_marker(previous)
+        ):
+            pieces.append(" ")
+        pieces.append(segment_text)
+        previous = segment_text
 
     # Add sentence-level breaks at end of line
     if sentence.breaks_after:
-        break_marker = _format_breaks(sentence.breaks_after)
-        sentence_text += " " + break_marker
+        pieces.append(" ")
+        pieces.append(_format_breaks(sentence.breaks_after))
+
+    return "".join(pieces).strip()
+
 
-    return sentence_text.strip()
+def _format_segment(segment: Segment) -> str:
+    """Render a segment as SSMD, skipping markup assembly for plain text.
+
+    Most segments in ordinary prose carry no markup at all; for those the
+    rendered form is simply the segment text.
+    """
+    # Ordered roughly by how often each attribute is set in parsed documents,
+    # so marked-up segments leave the check as early as possible.
+    if not (
+        segment.emphasis
+        or segment.breaks_after
+        or segment.breaks_before
+        or segment.language
+        or segment.say_as
+        or segment.substitution
+        or segment.prosody
+        or segment.phoneme
+        or segment.marks_before
+        or segment.marks_after
+        or segment.voice
+        or segment.extension
+        or segment.audio
+    ):
+        return segment.text
+    return segment.to_ssmd()
 
 
 def _ends_with_break_marker(text: str) -> bool:
     """Check if text ends with a break marker like ...s, ...500ms, etc."""
-    import re
-
-    # Break marker pattern: ... followed by strength letter or time
-    return bool(re.search(r"\.\.\.[swcpn]$|\.\.\.\d+(ms|s)$", text.rstrip()))
+    return _TRAILING_BREAK_MARKER_PATTERN.search(text.rstrip()) is not None
 
 
 def _format_breaks(breaks: list[BreakAttrs]) -> str:
@@ -202,49 +286,77 @@ def _format_breaks(breaks: list[BreakAttrs]) -> str:
     if not breaks:
         return ""
 
-    # Format each break
-    break_markers = []
-    for brk in breaks:
-        if brk.time:
-            # Time-based break: ...500ms or ...2s
-            break_markers.append(f"...{brk.time}")
-        elif brk.strength:
-            # Strength-based break
-            marker = SSMD_BREAK_STRENGTH_MAP.get(brk.strength, "...s")
-            break_markers.append(marker)
-        else:
-            # Default to strong break
-            break_markers.append("...s")
+    # Most boundaries carry a single pause; skip the list and join for them
+    if len(breaks) == 1:
+        return _format_break(breaks[0])
+
+    return " ".join([_format_break(brk) for brk in breaks])
+
 
-    return " ".join(break_markers)
+def _format_break(brk: BreakAttrs) -> str:
+    """Convert a single break to its SSMD marker."""
+    if brk.time:
+        # Time-based break: ...500ms or ...2s
+        return f"...{brk.time}"
+    if brk.strength:
+        # Strength-based break
+        return SSMD_BREAK_STRENGTH_MAP.get(brk.strength, "...s")
+    # Default to strong break
+    return "...s"
 
 
 def _format_div_directive(sentence: Sentence) -> str:
     """Format a <div> directive for voice/lang/prosody."""
-    from ssmd.segment import _escape_xml_attr
+    voice = sentence.voice
+    prosody = sentence.prosody
+    return _format_div_directive_cached(
+        getattr(voice, "name", None),
+        getattr(voice, "language", None),
+        getattr(voice, "gender", None),
+        getattr(voice, "variant", None),
+        sentence.language,
+        getattr(prosody, "volume", None),
+        getattr(prosody, "rate", None),
+        getattr(prosody, "pitch", None),
+    )
+
 
+@lru_cache(maxsize=256)
+def _format_div_directive_cached(
+    voice_name: str | None,
+    voice_language: str | None,
+    gender: str | None,
+    variant: int | None,
+    language: str | None,
+    volume: str | None,
+    rate: str | None,
+    pitch: str | None,
+) -> str:
+    """Format a <div> directive from already extracted, hashable attribute values.
+
+    Documents usually switch between a handful of voices, so the rendered
+    directive strings are memoized.
+    """
     parts: list[str] = []
 
-    if sentence.voice:
-        if sentence.voice.name:
-            parts.append(f'voice="{_escape_xml_attr(sentence.voice.name)}"')
-        if sentence.voice.language:
-            parts.append(f'voice-lang="{_escape_xml_attr(sentence.voice.language)}"')
-        if sentence.voice.gender:
-            parts.append(f'gender="{_escape_xml_attr(sentence.voice.gender)}"')
-        if sentence.voice.variant is not None:
-            parts.append(f'variant="{sentence.voice.variant}"')
-
-    if sentence.language:
-        parts.append(f'lang="{_escape_xml_attr(sentence.language)}"')
-
-    if sentence.prosody:
-        if sentence.prosody.volume:
-            parts.append(f'volume="{_escape_xml_attr(sentence.prosody.volume)}"')
-        if sentence.prosody.rate:
-            parts.append(f'rate="{_escape_xml_attr(sentence.prosody.rate)}"')
-        if sentence.prosody.pitch:
-            parts.append(f'pitch="{_escape_xml_attr(sentence.prosody.pitch)}"')
+    if voice_name:
+        parts.append(f'voice="{_escape_xml_attr(voice_name)}"')
+    if voice_language:
+        parts.append(f'voice-lang="{_escape_xml_attr(voice_language)}"')
+    if gender:
+        parts.append(f'gender="{_escape_xml_attr(gender)}"')
+    if variant is not None:
+        parts.append(f'variant="{variant}"')
+
+    if language:
+        parts.append(f'lang="{_escape_xml_attr(language)}"')
+
+    if volume:
+        parts.append(f'volume="{_escape_xml_attr(volume)}"')
+    if rate:
+        parts.append(f'rate="{_escape_xml_attr(rate)}"')
+    if pitch:
+        parts.append(f'pitch="{_escape_xml_attr(pitch)}"')
 
     if not parts:
         return ""
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from ssmd.sentence import Sentence
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """A paragraph containing sentences.
 
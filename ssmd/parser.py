@@ -5,9 +5,17 @@ that can be used for TTS processing or conversion to SSML.
 """
 
 import re
+import sys
 import warnings
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
+import phrasplit
+
 from ssmd.paragraph import Paragraph
 from ssmd.segment import Segment
 from ssmd.sentence import Sentence
@@ -51,6 +59,10 @@ if TYPE_CHECKING:
 DIV_DIRECTIVE_START = re.compile(r"^\s*<div\s+([^>]+)>\s*$", re.IGNORECASE)
 DIV_DIRECTIVE_END = re.compile(r"^\s*</div>\s*$", re.IGNORECASE)
 
+# Whole-text variant of the two patterns above.  It only finds the tag; the
+# caller checks that the tag is alone on its line.
+DIV_DIRECTIVE_TAG = re.compile(r"<(?:div[^\S\n]+([^>\n]+)|(/div))>", re.IGNORECASE)
+
 # Emphasis patterns
 STRONG_EMPHASIS_PATTERN = re.compile(r"\*\*([^\*]+)\*\*")
 MODERATE_EMPHASIS_PATTERN = re.compile(r"\*([^\*]+)\*")
@@ -82,8 +94,51 @@ HEADING_PATTERN = re.compile(r"^\s*(#{1,6})\s*(.+)$", re.MULTILINE)
 # Paragraph break: two or more newlines
 PARAGRAPH_PATTERN = re.compile(r"\n\n+")
 
-# Space before punctuation (to normalize)
-SPACE_BEFORE_PUNCT = re.compile(r"\s+([.!?,:;])")
+# Sentence post-processing: break-only sentences, single-letter abbreviations,
+# line and !/? boundaries, and heading markers left on their own
+BREAK_ONLY_SENTENCE_PATTERN = re.compile(r"^(?:\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])\s*)+$")
+SINGLE_LETTER_ABBREVIATION_PATTERN = re.compile(r"^(?:[A-Za-z]\.)+$")
+LINE_BREAKS_PATTERN = re.compile(r"\n+")
+EXCLAMATION_QUESTION_BOUNDARY_PATTERN = re.compile(r"(?<=[!?])\s+(?=[A-Z])")
+HEADING_PREFIX_PATTERN = re.compile(r"^\s*#{1,6}\s+")
+HEADING_MARKER_PATTERN = re.compile(r"^\s*#{1,6}\s*$")
+SENTENCE_TERMINATOR_END_PATTERN = re.compile(r"[.!?]\s*$")
+
+# Private-use characters that stand in for protected spans during sentence
+# splitting; built once so escaping reuses the same one-character strings
+_PLACEHOLDER_BASE = 0xF100
+_PLACEHOLDER_CHARS = tuple(chr(codepoint) for codepoint in range(_PLACEHOLDER_BASE, 0xF900))
+
+# Non-alphanumeric characters allowed in annotation attribute keys
+_ANNOTATION_KEY_PUNCTUATION = str.maketrans("", "", "_-:")
+
+# Punctuation that attaches to the preceding word when normalizing
+_ATTACHING_PUNCTUATION = frozenset(".!?,:;")
+
+# Annotation keys that select a voice or a prosody change
+_VOICE_PARAM_KEYS = frozenset({"voice", "voice-lang", "voice_lang", "gender", "variant"})
+_PROSODY_PARAM_KEYS = frozenset({"volume", "rate", "pitch", "v", "r", "p"})
+
+# Voice genders from VoiceAttrs; only these bounded values are interned
+_VOICE_GENDERS = frozenset({"male", "female", "neutral"})
+
+# Anything that could make the regex sentence splitter break or rewrite a text:
+# terminators, colons/semicolons, line breaks and non-trivial whitespace
+_SENTENCE_SPLIT_HINT_PATTERN = re.compile(r"[.!?:;\u2026\u3002\uff01\uff1f]|\s\s|[^\S ]")
+
+# All inline markup tokens in one scan
+# Order matters: longer patterns first
+INLINE_MARKUP_PATTERN = re.compile(
+    r"("
+    r"\*\*[^\*]+\*\*"  # **strong**
+    r"|\*[^\*]+\*"  # *moderate*
+    r"|~~[^~]+~~"  # ~~reduced~~
+    r"|(?<![_a-zA-Z0-9])_(?!_)[^_]+?(?<!_)_(?![_a-zA-Z0-9])"  # _reduced_
+    r"|\[[^\]]*\]\{(?:\\.|[^}])+\}"  # [text]{annotation}
+    r"|\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])(?=\s|$|[.!?,;:])"  # breaks
+    r"|(?<!\S)@(?!voice[:(])\w+(?=\s|$)"  # marks
+    r")"
+)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -97,9 +152,19 @@ def _normalize_text(text: str) -> str:
     - Removes space before punctuation
     - Collapses multiple spaces
     """
-    text = SPACE_BEFORE_PUNCT.sub(r"\1", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    # str.split() collapses and trims whitespace in one pass; words starting
+    # with punctuation are then glued to their predecessor.
+    words = text.split()
+    if len(words) < 2:
+        return words[0] if words else ""
+
+    normalized = [words[0]]
+    for word in words[1:]:
+        if word[0] in _ATTACHING_PUNCTUATION:
+            normalized[-1] += word
+        else:
+            normalized.append(word)
+    return " ".join(normalized)
 
 
 def parse_paragraphs(
@@ -141,13 +206,49 @@ def parse_paragraphs(
     Returns:
         List of Paragraph objects
     """
+    paragraphs, diagnostics = _paragraph_stream(
+        text,
+        capabilities=capabilities,
+        heading_levels=heading_levels,
+        extensions=extensions,
+        sentence_detection=sentence_detection,
+        language=language,
+        use_spacy=use_spacy,
+        spacy_model=spacy_model,
+        model_size=model_size,
+        parse_yaml_header=parse_yaml_header,
+        strict_parse=strict_parse,
+    )
+    return ParsedResult(paragraphs, diagnostics=diagnostics)
+
+
+def _paragraph_stream(
+    text: str,
+    *,
+    capabilities: "TTSCapabilities | str | None",
+    heading_levels: dict | None,
+    extensions: dict | None,
+    sentence_detection: bool,
+    language: str | None,
+    use_spacy: bool | None,
+    spacy_model: str | None,
+    model_size: SpacyModelSize | None,
+    parse_yaml_header: bool,
+    strict_parse: bool,
+) -> tuple[Iterator[Paragraph], SentenceDetectionDiagnostics | None]:
+    """Prepare text for parsing and return a lazy paragraph iterator.
+
+    Front matter, directive blocks and sentence detection are resolved up
+    front. Each paragraph is split into sentences and parsed only when the
+    iterator reaches it.
+    """
     sentence_config = SentenceDetectionConfig(
         use_spacy=use_spacy,
         spacy_model=spacy_model,
         model_size=model_size,
     )
     if not text or not text.strip():
-        return ParsedResult()
+        return iter(()), None
 
     from ssmd.frontmatter import parse_front_matter
     from ssmd.utils import build_config_from_header
@@ -166,15 +267,13 @@ def parse_paragraphs(
     # Split text into directive blocks
     directive_blocks = _split_directive_blocks(text)
 
-    paragraphs: list[Paragraph] = []
-    paragraph_index = 0
-    sentence_index = 0
-    detection_diagnostics: SentenceDetectionDiagnostics | None = None
-
+    # Collect every paragraph first so sentence detection is set up only once
+    block_paragraph_items: list[tuple[DirectiveAttrs, str, bool]] = []
     for block_index, (directive, block_text) in enumerate(directive_blocks):
         is_last_block = block_index == len(directive_blocks) - 1
-        # Split block into paragraphs
-        block_paragraphs = PARAGRAPH_PATTERN.split(block_text)
+        # Split block into paragraphs. Longer newline runs leave empty or
+        # newline-prefixed pieces, which the strip below discards or trims.
+        block_paragraphs = block_text.split("\n\n")
 
         for para_idx, paragraph in enumerate(block_paragraphs):
             paragraph = paragraph.strip()
@@ -183,60 +282,80 @@ def parse_paragraphs(
 
             is_last_paragraph = para_idx == len(block_paragraphs) - 1
             paragraph_boundary = not is_last_paragraph or not is_last_block
+            block_paragraph_items.append((directive, paragraph, paragraph_boundary))
 
-            # Split paragraph into sentences if enabled
-            if sentence_detection:
-                split_result = _split_sentences(
-                    paragraph,
-                    language=language,
-                    use_spacy=use_spacy,
-                    spacy_model=sentence_config.spacy_model,
-                    model_size=sentence_config.model_size,
-                )
-                sent_texts: list[str] = list(split_result)
-                detection_diagnostics = split_result.diagnostics
-            else:
-                sent_texts = [paragraph]
+    split_sentences: Callable[[str], list[str]] | None = None
+    detection_diagnostics: SentenceDetectionDiagnostics | None = None
+    if sentence_detection and block_paragraph_items:
+        split_sentences, detection_diagnostics = _sentence_splitter(
+            language=language,
+            use_spacy=use_spacy,
+            spacy_model=sentence_config.spacy_model,
+            model_size=sentence_config.model_size,
+        )
 
-            paragraph_sentences: list[Sentence] = []
+    paragraphs = _iter_paragraph_objects(
+        block_paragraph_items,
+        split_sentences,
+        caps=caps,
+        heading_levels=heading_levels,
+        extensions=extensions,
+        strict_parse=strict_parse,
+    )
+    return paragraphs, detection_diagnostics
 
-            for sent_idx, sent_text in enumerate(sent_texts):
-                sent_text = sent_text.strip()
-                if not sent_text:
-                    continue
 
-                is_last_sent_in_para = sent_idx == len(sent_texts) - 1
+def _iter_paragraph_objects(
+    block_paragraph_items: list[tuple[DirectiveAttrs, str, bool]],
+    split_sentences: Callable[[str], list[str]] | None,
+    *,
+    caps: "TTSCapabilities | None",
+    heading_levels: dict | None,
+    extensions: dict | None,
+    strict_parse: bool,
+) -> Iterator[Paragraph]:
+    """Split and parse collected paragraphs one at a time."""
+    paragraph_index = 0
+    sentence_index = 0
+
+    for directive, paragraph, paragraph_boundary in block_paragraph_items:
+        # Split paragraphs into sentences if enabled
+        sent_texts = split_sentences(paragraph) if split_sentences else [paragraph]
+        paragraph_sentences: list[Sentence] = []
 
-                # Parse the sentence content into segments
-                segments = _parse_segments(
-                    sent_text,
-                    capabilities=caps,
-                    heading_levels=heading_levels,
-                    extensions=extensions,
-                )
+        for sent_idx, sent_text in enumerate(sent_texts):
+            sent_text = sent_text.strip()
+            if not sent_text:
+                continue
 
-                if segments:
-                    sentence = Sentence(
-                        segments=segments,
-                        voice=directive.voice,
-                        language=directive.language,
-                        prosody=directive.prosody,
-                        is_paragraph_end=is_last_sent_in_para and paragraph_boundary,
-                        paragraph_index=paragraph_index,
-                        sentence_index=sentence_index,
-                    )
-                    paragraph_sentences.append(sentence)
-                    sentence_index += 1
+            is_last_sent_in_para = sent_idx == len(sent_texts) - 1
 
-            if paragraph_sentences:
-                paragraphs.append(Paragraph(sentences=paragraph_sentences))
-                paragraph_index += 1
+            # Parse the sentence content into segments
+            segments = _parse_segments(
+                sent_text,
+                capabilities=caps,
+                heading_levels=heading_levels,
+                extensions=extensions,
+            )
 
-    if strict_parse and caps:
-        all_sentences = [sentence for paragraph in paragraphs for sentence in paragraph.sentences]
-        _filter_sentences(all_sentences, caps)
+            if segments:
+                sentence = Sentence(
+                    segments=segments,
+                    voice=directive.voice,
+                    language=directive.language,
+                    prosody=directive.prosody,
+                    is_paragraph_end=is_last_sent_in_para and paragraph_boundary,
+                    paragraph_index=paragraph_index,
+                    sentence_index=sentence_index,
+                )
+                paragraph_sentences.append(sentence)
+                sentence_index += 1
 
-    return ParsedResult(paragraphs, diagnostics=detection_diagnostics)
+        if paragraph_sentences:
+            if strict_parse and caps:
+                _filter_sentences(paragraph_sentences, caps)
+            yield Paragraph(sentences=paragraph_sentences)
+            paragraph_index += 1
 
 
 def parse_ssmd(
@@ -279,89 +398,73 @@ def _resolve_capabilities(
     if capabilities is None:
         return None
     if isinstance(capabilities, str):
-        from ssmd.capabilities import get_preset
-
-        return get_preset(capabilities)
+        return _resolve_preset(capabilities)
     return capabilities
 
 
-def _split_directive_blocks(text: str) -> list[tuple[DirectiveAttrs, str]]:
-    """Split text into directive blocks defined by <div ...> tags."""
-    blocks: list[tuple[DirectiveAttrs, str]] = []
-    stack: list[DirectiveAttrs] = [DirectiveAttrs()]
-    current_lines: list[str] = []
-
-    def flush_block() -> None:
-        if not current_lines:
-            return
-        block_text = "\n".join(current_lines)
-        if block_text.strip():
-            blocks.append((stack[-1], block_text))
-        current_lines.clear()
-
-    for line in text.split("\n"):
-        start_match = DIV_DIRECTIVE_START.match(line)
-        if start_match:
-            flush_block()
-            attrs = _parse_div_attrs(start_match.group(1))
-            stack.append(_merge_directives(stack[-1], attrs))
-            continue
-
-        if DIV_DIRECTIVE_END.match(line):
-            if len(stack) > 1:
-                flush_block()
-                stack.pop()
-                continue
-            current_lines.append(line)
-            continue
+@lru_cache(maxsize=32)
+def _resolve_preset(name: str) -> "TTSCapabilities":
+    """Load a capability preset once per name.
 
-        current_lines.append(line)
+    The parser only reads capabilities, so repeated parses with the same
+    preset name share one instance instead of deep-copying it every call.
+    """
+    from ssmd.capabilities import get_preset
 
-    flush_block()
+    return get_preset(name)
 
-    if not blocks and text.strip():
-        blocks.append((DirectiveAttrs(), text.strip()))
 
+def _split_directive_blocks(text: str) -> list[tuple[DirectiveAttrs, str]]:
+    """Split text into directive blocks defined by <div ...> tags."""
+    blocks, _ = _split_directive_blocks_with_warnings(text)
     return blocks
 
 
 def _split_directive_blocks_with_warnings(
     text: str,
 ) -> tuple[list[tuple[DirectiveAttrs, str]], list[str]]:
-    """Split directive blocks and collect parse warnings."""
+    """Split directive blocks and collect parse warnings.
+
+    Directive tags are located with one DIV_DIRECTIVE_TAG scan over the whole
+    text; block text is sliced out between directive lines.
+    """
     blocks: list[tuple[DirectiveAttrs, str]] = []
     warnings: list[str] = []
     stack: list[DirectiveAttrs] = [DirectiveAttrs()]
-    current_lines: list[str] = []
+    block_start = 0
 
-    def flush_block() -> None:
-        if not current_lines:
-            return
-        block_text = "\n".join(current_lines)
-        if block_text.strip():
+    def flush_block(block_end: int) -> None:
+        # block_end is the start of a directive line; drop its leading newline
+        block_text = text[block_start : block_end - 1] if block_end > block_start else ""
+        if block_text and not block_text.isspace():
             blocks.append((stack[-1], block_text))
-        current_lines.clear()
 
-    for line in text.split("\n"):
-        start_match = DIV_DIRECTIVE_START.match(line)
-        if start_match:
-            flush_block()
-            attrs = _parse_div_attrs(start_match.group(1))
-            stack.append(_merge_directives(stack[-1], attrs))
+    for match in DIV_DIRECTIVE_TAG.finditer(text):
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        line_end = text.find("\n", match.end())
+        if line_end == -1:
+            line_end = len(text)
+        before = text[line_start : match.start()]
+        after = text[match.end() : line_end]
+        if (before and not before.isspace()) or (after and not after.isspace()):
             continue
 
-        if DIV_DIRECTIVE_END.match(line):
-            if len(stack) > 1:
-                flush_block()
-                stack.pop()
+        if match.group(2) is not None:
+            if len(stack) == 1:
+                # Unmatched </div> stays part of the surrounding text
+                warnings.append("Unexpected </div> without matching <div>.")
                 continue
-            warnings.append("Unexpected </div> without matching <div>.")
-            current_lines.append(line)
-            continue
-
-        current_lines.append(line)
+            flush_block(line_start)
+            stack.pop()
+        else:
+            flush_block(line_start)
+            attrs = _parse_div_attrs(match.group(1))
+            stack.append(_merge_directives(stack[-1], attrs))
+        block_start = line_end + 1
 
-    flush_block()
+    tail = text[block_start:]
+    if tail and not tail.isspace():
+        blocks.append((stack[-1], tail))
 
     if len(stack) > 1:
         warnings.append("Unclosed <div> directive block.")
@@ -413,10 +516,10 @@ def _merge_voice(base: VoiceAttrs | None, update: VoiceAttrs | None) -> VoiceAtt
 
     merged = VoiceAttrs()
     for field_name in ("name", "language", "gender", "variant"):
-        update_value = getattr(update, field_name) if update else None
+        update_value = getattr(update, field_name, None)
         if update_value in (None, ""):
             update_value = None
-        base_value = getattr(base, field_name) if base else None
+        base_value = getattr(base, field_name, None)
         setattr(merged, field_name, update_value if update_value is not None else base_value)
 
     if not any([merged.name, merged.language, merged.gender, merged.variant is not None]):
@@ -433,10 +536,10 @@ def _merge_prosody(
 
     merged = ProsodyAttrs()
     for field_name in ("volume", "rate", "pitch"):
-        update_value = getattr(update, field_name) if update else None
+        update_value = getattr(update, field_name, None)
         if update_value in (None, ""):
             update_value = None
-        base_value = getattr(base, field_name) if base else None
+        base_value = getattr(base, field_name, None)
         setattr(merged, field_name, update_value if update_value is not None else base_value)
 
     if not any([merged.volume, merged.rate, merged.pitch]):
@@ -454,22 +557,35 @@ def _split_sentences(
     escape_annotations: bool = True,
 ) -> ParsedResult[str]:
     """Split text into sentences using phrasplit."""
-    sentence_config = SentenceDetectionConfig(
+    split_sentences, diagnostics = _sentence_splitter(
+        language=language,
         use_spacy=use_spacy,
         spacy_model=spacy_model,
         model_size=model_size,
+        escape_annotations=escape_annotations,
     )
-    try:
-        import phrasplit
-    except ImportError:
-        return ParsedResult(
-            _simple_sentence_split(text),
-            diagnostics=SentenceDetectionDiagnostics(
-                selection_mode="fallback",
-                effective_language=language or "en",
-            ),
-        )
+    return ParsedResult(split_sentences(text), diagnostics=diagnostics)
+
 
+def _sentence_splitter(
+    language: str | None = None,
+    use_spacy: bool | None = None,
+    spacy_model: str | None = None,
+    model_size: SpacyModelSize | None = None,
+    *,
+    escape_annotations: bool = True,
+) -> tuple[Callable[[str], list[str]], SentenceDetectionDiagnostics]:
+    """Set up sentence detection once and return a per-text splitter.
+
+    Model resolution, diagnostics and configuration warnings are handled here,
+    so callers can split any number of texts, one at a time, without repeating
+    them.
+    """
+    sentence_config = SentenceDetectionConfig(
+        use_spacy=use_spacy,
+        spacy_model=spacy_model,
+        model_size=model_size,
+    )
     language_hint = language or "en"
     resolution = None
     if sentence_config.use_spacy is False:
@@ -505,34 +621,74 @@ def _split_sentences(
         selected_model_size=resolution.model_size if resolution else None,
     )
 
+    if sentence_config.spacy_model and sentence_config.model_size:
+        warnings.warn(
+            "model_size is ignored when an explicit model is supplied.",
+            UserWarning,
+            stacklevel=2,
+        )
+
+    regex_only = diagnostics.selected_model is None
+    # Repeated paragraphs (intros, refrains) are split once per setup; the
+    # cache lives only as long as the splitter, so it never goes stale.
+    split_cache: dict[str, list[str]] = {}
+
+    def split_sentences(text: str) -> list[str]:
+        if regex_only and _is_single_sentence(text):
+            return [text]
+        sentences = split_cache.get(text)
+        if sentences is None:
+            sentences = _split_text_sentences(
+                text, language_hint, sentence_config, escape_annotations
+            )
+            split_cache[text] = sentences
+        return sentences.copy()
+
+    return split_sentences, diagnostics
+
+
+def _is_single_sentence(text: str) -> bool:
+    """Check whether the regex splitter would return text unchanged as one sentence.
+
+    Only valid when no spaCy model is in use; a model may split text that has
+    no punctuation at all.
+    """
+    return (
+        bool(text)
+        and text[0] != " "
+        and text[-1] != " "
+        and _SENTENCE_SPLIT_HINT_PATTERN.search(text) is None
+    )
+
+
+def _split_text_sentences(
+    text: str,
+    language_hint: str,
+    sentence_config: SentenceDetectionConfig,
+    escape_annotations: bool,
+) -> list[str]:
+    """Split one text into sentences with an already resolved configuration."""
     should_escape = escape_annotations
     escaped_text = text
-    placeholder_values: list[str] = []
-    placeholder_tokens: list[str] = []
-    if should_escape:
-        placeholder_base = 0xF100
+    placeholder_map: dict[int, str] = {}
+    # Text without any markup start character has nothing to protect
+    if should_escape and _may_contain_markup(text):
 
         def _replace_placeholder(match: re.Match[str]) -> str:
-            placeholder_values.append(match.group(0))
-            placeholder = chr(placeholder_base + len(placeholder_values) - 1)
-            placeholder_tokens.append(placeholder)
-            return placeholder
-
-        escaped_text = re.sub(r"\[[^\]]*\]\{(?:\\.|[^}])*\}", _replace_placeholder, escaped_text)
-        escaped_text = re.sub(
-            r"\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])(?=\s|$|[.!?,;:])",
-            _replace_placeholder,
-            escaped_text,
-        )
+            # Spans matched by later patterns may already contain placeholders;
+            # store them expanded so a single translate() restores everything.
+            index = len(placeholder_map)
+            codepoint = _PLACEHOLDER_BASE + index
+            placeholder_map[codepoint] = match.group(0).translate(placeholder_map)
+            if index < len(_PLACEHOLDER_CHARS):
+                return _PLACEHOLDER_CHARS[index]
+            return chr(codepoint)
+
+        escaped_text = ANNOTATION_PATTERN.sub(_replace_placeholder, escaped_text)
+        escaped_text = BREAK_PATTERN.sub(_replace_placeholder, escaped_text)
         for markup_pattern in INLINE_SENTENCE_MARKUP_PATTERNS:
             escaped_text = markup_pattern.sub(_replace_placeholder, escaped_text)
 
-    if sentence_config.spacy_model and sentence_config.model_size:
-        warnings.warn(
-            "model_size is ignored when an explicit model is supplied.",
-            UserWarning,
-            stacklevel=2,
-        )
     with warnings.catch_warnings():
         warnings.filterwarnings(
             "ignore",
@@ -550,21 +706,12 @@ def _split_sentences(
             model_size=sentence_config.model_size,
         )
 
-    # Group segments by sentence.
-    sentences = []
-    current = ""
-    last_sent_id = None
-
-    for seg in segments:
-        if last_sent_id is not None and seg.sentence != last_sent_id:
-            if current.strip():
-                sentences.append(current)
-            current = ""
-        current += seg.text
-        last_sent_id = seg.sentence
-
-    if current.strip():
-        sentences.append(current)
+    # Group consecutive segments by sentence.
+    sentences: list[str] = []
+    for _, sentence_segments in groupby(segments, key=attrgetter("sentence")):
+        current = "".join([seg.text for seg in sentence_segments])
+        if current.strip():
+            sentences.append(current)
 
     line_boundary_sentences: list[str] = []
     for sentence in sentences:
@@ -573,23 +720,17 @@ def _split_sentences(
     sentences = _merge_nonterminal_fragments(sentences)
 
     if not should_escape:
-        return ParsedResult(sentences if sentences else [text], diagnostics=diagnostics)
+        return sentences if sentences else [text]
 
     if not sentences:
-        return ParsedResult([text], diagnostics=diagnostics)
+        return [text]
 
-    restored_sentences: list[str] = []
-    for sentence in sentences:
-        restored = sentence
-        for placeholder_index, original_value in enumerate(placeholder_values):
-            restored = restored.replace(placeholder_tokens[placeholder_index], original_value)
-        restored_sentences.append(restored)
+    restored_sentences = [sentence.translate(placeholder_map) for sentence in sentences]
 
     merged_sentences: list[str] = []
-    break_only_pattern = re.compile(r"^(?:\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])\s*)+$")
     for sentence in restored_sentences:
         stripped = sentence.strip()
-        if stripped and break_only_pattern.match(stripped) and merged_sentences:
+        if stripped and BREAK_ONLY_SENTENCE_PATTERN.match(stripped) and merged_sentences:
             merged_sentences[-1] = merged_sentences[-1].rstrip() + " " + stripped
         else:
             merged_sentences.append(sentence)
@@ -598,18 +739,17 @@ def _split_sentences(
         merged_sentences[idx] = sentence.rstrip() + "\n"
 
     merged_sentences = _merge_single_letter_abbreviations(merged_sentences)
-    return ParsedResult(merged_sentences, diagnostics=diagnostics)
+    return merged_sentences
 
 
 def _merge_single_letter_abbreviations(sentences: list[str]) -> list[str]:
     """Keep a run of single-letter abbreviations in one sentence."""
     merged: list[str] = []
-    single_letter = re.compile(r"^(?:[A-Za-z]\.)+$")
     for sentence in sentences:
         if (
             merged
-            and single_letter.fullmatch(merged[-1].strip())
-            and single_letter.fullmatch(sentence.strip())
+            and SINGLE_LETTER_ABBREVIATION_PATTERN.fullmatch(merged[-1].strip())
+            and SINGLE_LETTER_ABBREVIATION_PATTERN.fullmatch(sentence.strip())
         ):
             merged[-1] = f"{merged[-1].rstrip()} {sentence.lstrip()}"
         else:
@@ -620,20 +760,19 @@ def _merge_single_letter_abbreviations(sentences: list[str]) -> list[str]:
 def _split_line_sentence_boundaries(text: str) -> list[str]:
     """Preserve SSMD line and heading boundaries lost by model segmentation."""
     lines: list[str] = []
-    for line in re.split(r"\n+", text):
-        lines.extend(re.split(r"(?<=[!?])\s+(?=[A-Z])", line))
+    for line in LINE_BREAKS_PATTERN.split(text):
+        lines.extend(EXCLAMATION_QUESTION_BOUNDARY_PATTERN.split(line))
     if len(lines) == 1:
         return lines
 
     parts: list[str] = []
     current = lines[0]
-    heading = re.compile(r"^\s*#{1,6}\s+")
     for line in lines[1:]:
         current_stripped = current.strip()
         if (
-            re.search(r"[.!?]\s*$", current_stripped)
-            or heading.match(current_stripped)
-            or heading.match(line)
+            SENTENCE_TERMINATOR_END_PATTERN.search(current_stripped)
+            or HEADING_PREFIX_PATTERN.match(current_stripped)
+            or HEADING_PREFIX_PATTERN.match(line)
         ):
             parts.append(current)
             current = line
@@ -646,29 +785,21 @@ def _split_line_sentence_boundaries(text: str) -> list[str]:
 def _merge_nonterminal_fragments(sentences: list[str]) -> list[str]:
     """Reassemble long-text chunks that phrasplit kept without punctuation."""
     merged: list[str] = []
-    heading_marker = re.compile(r"^\s*#{1,6}\s*$")
     for sentence in sentences:
-        if merged and heading_marker.fullmatch(merged[-1]):
+        if merged and HEADING_MARKER_PATTERN.fullmatch(merged[-1]):
             marker = merged.pop().strip()
             heading_line, separator, remainder = sentence.partition("\n")
             merged.append(f"{marker} {heading_line.strip()}")
             if separator and remainder.strip():
                 merged.append(remainder)
             continue
-        if merged and not re.search(r"[.!?]\s*$", merged[-1].strip()):
+        if merged and not SENTENCE_TERMINATOR_END_PATTERN.search(merged[-1].strip()):
             merged[-1] = f"{merged[-1].rstrip()} {sentence.lstrip()}"
         else:
             merged.append(sentence)
     return merged
 
 
-def _simple_sentence_split(text: str) -> list[str]:
-    """Simple regex-based sentence splitting."""
-    # Split on sentence-ending punctuation followed by space or newline
-    parts = re.split(r"(?<=[.!?])\s+", text)
-    return [p.strip() for p in parts if p.strip()]
-
-
 def _parse_segments(  # noqa: C901
     text: str,
     capabilities: "TTSCapabilities | None" = None,
@@ -681,47 +812,23 @@ def _parse_segments(  # noqa: C901
     if heading_match:
         return _parse_heading(heading_match, heading_levels or DEFAULT_HEADING_LEVELS)
 
+    if not _may_contain_markup(text):
+        plain = _normalize_text(text)
+        return [Segment(text=plain)] if plain else []
+
     segments: list[Segment] = []
     position = 0
+    pending = _PendingMarkup()
 
-    # Build combined pattern for all markup
-    # Order matters: longer patterns first
-    combined = re.compile(
-        r"("
-        r"\*\*[^\*]+\*\*"  # **strong**
-        r"|\*[^\*]+\*"  # *moderate*
-        r"|~~[^~]+~~"  # ~~reduced~~
-        r"|(?<![_a-zA-Z0-9])_(?!_)[^_]+?(?<!_)_(?![_a-zA-Z0-9])"  # _reduced_
-        r"|\[[^\]]*\]\{(?:\\.|[^}])+\}"  # [text]{annotation}
-        r"|\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])(?=\s|$|[.!?,;:])"  # breaks
-        r"|(?<!\S)@(?!voice[:(])\w+(?=\s|$)"  # marks
-        r")"
-    )
-
-    pending_breaks: list[BreakAttrs] = []
-    pending_marks: list[str] = []
-
-    for match in combined.finditer(text):
+    for match in INLINE_MARKUP_PATTERN.finditer(text):
         if match.start() > position:
             plain = _normalize_text(text[position : match.start()])
             if plain:
                 seg = Segment(text=plain)
-                if pending_breaks:
-                    seg.breaks_before = pending_breaks
-                    pending_breaks = []
-                if pending_marks:
-                    seg.marks_before = pending_marks
-                    pending_marks = []
+                pending.apply_to(seg)
                 segments.append(seg)
 
-        markup = match.group(0)
-        pending_breaks, pending_marks, markup_seg = _handle_markup(
-            markup,
-            segments,
-            pending_breaks,
-            pending_marks,
-            extensions,
-        )
+        markup_seg = _handle_markup(match.group(0), segments, pending, extensions)
         if markup_seg:
             segments.append(markup_seg)
 
@@ -732,92 +839,156 @@ def _parse_segments(  # noqa: C901
         plain = _normalize_text(text[position:])
         if plain:
             seg = Segment(text=plain)
-            _apply_pending(seg, pending_breaks, pending_marks)
+            pending.apply_to(seg)
             segments.append(seg)
 
     # If no segments created but we have text, create a plain segment
     if not segments and text.strip():
         seg = Segment(text=text.strip())
-        _apply_pending(seg, pending_breaks, pending_marks)
+        pending.apply_to(seg)
         segments.append(seg)
 
     return segments
 
 
+def _may_contain_markup(text: str) -> bool:
+    """Check for any character an INLINE_MARKUP_PATTERN token starts with.
+
+    Plain prose usually has none, and these substring checks are much cheaper
+    than running the markup scan.
+    """
+    return "*" in text or "[" in text or "_" in text or "@" in text or "~" in text or "..." in text
+
+
 def _handle_markup(
     markup: str,
     segments: list[Segment],
-    pending_breaks: list[BreakAttrs],
-    pending_marks: list[str],
+    pending: "_PendingMarkup",
     extensions: dict | None,
-) -> tuple[list[BreakAttrs], list[str], Segment | None]:
-    """Handle a single markup token and return any segment."""
-    if markup.startswith("..."):
-        brk = _parse_break(markup[3:])
-        if segments:
-            segments[-1].breaks_after.append(brk)
-        else:
-            pending_breaks.append(brk)
-        return pending_breaks, pending_marks, None
+) -> Segment | None:
+    """Handle a single markup token and return any segment.
 
-    if markup.startswith("@"):
-        mark_name = markup[1:]
-        if segments:
-            segments[-1].marks_after.append(mark_name)
-        else:
-            pending_marks.append(mark_name)
-        return pending_breaks, pending_marks, None
+    Every token class produced by INLINE_MARKUP_PATTERN starts with a
+    distinct character, so the handler is chosen with one dict lookup.
+    Breaks and marks that precede the first segment are collected on pending.
+    """
+    handler = _MARKUP_DISPATCH.get(markup[:1], _handle_segment_markup)
+    return handler(markup, segments, pending, extensions)
+
+
+def _handle_break_markup(
+    markup: str,
+    segments: list[Segment],
+    pending: "_PendingMarkup",
+    extensions: dict | None,
+) -> Segment | None:
+    """Attach a ...break token to the previous segment or keep it pending."""
+    brk = _parse_break(markup[3:])
+    if segments:
+        segments[-1].breaks_after.append(brk)
+    else:
+        pending.breaks.append(brk)
+    return None
+
+
+def _handle_mark_markup(
+    markup: str,
+    segments: list[Segment],
+    pending: "_PendingMarkup",
+    extensions: dict | None,
+) -> Segment | None:
+    """Attach an @mark token to the previous segment or keep it pending."""
+    mark_name = markup[1:]
+    if segments:
+        segments[-1].marks_after.append(mark_name)
+    else:
+        pending.marks.append(mark_name)
+    return None
 
-    seg = _segment_from_markup(markup, extensions)
+
+def _handle_segment_markup(
+    markup: str,
+    segments: list[Segment],
+    pending: "_PendingMarkup",
+    extensions: dict | None,
+) -> Segment | None:
+    """Build a segment from emphasis or annotation markup."""
+    builder = _MARKUP_SEGMENT_BUILDERS.get(markup[:1])
+    seg = builder(markup, extensions) if builder else None
     if seg:
-        _apply_pending(seg, pending_breaks, pending_marks)
-        return [], [], seg
+        pending.apply_to(seg)
+    return seg
 
-    return pending_breaks, pending_marks, None
 
+def _star_emphasis_segment(markup: str, extensions: dict | None) -> Segment | None:
+    """Build a strong (**text**) or moderate (*text*) emphasis segment.
 
-def _segment_from_markup(markup: str, extensions: dict | None) -> Segment | None:
-    """Build a segment from emphasis, annotation, or prosody markup."""
-    if markup.startswith("**"):
-        inner = STRONG_EMPHASIS_PATTERN.match(markup)
-        if inner:
-            return Segment(text=inner.group(1), emphasis="strong")
-        return None
+    Tokens come from INLINE_MARKUP_PATTERN, so the delimiters are already
+    validated and the inner text is a plain slice.
+    """
+    if markup[1] == "*":
+        return Segment(text=markup[2:-2], emphasis="strong")
+    return Segment(text=markup[1:-1], emphasis=True)
 
-    if markup.startswith("*"):
-        inner = MODERATE_EMPHASIS_PATTERN.match(markup)
-        if inner:
-            return Segment(text=inner.group(1), emphasis=True)
-        return None
 
-    if markup.startswith("~~"):
-        inner = TILDE_REDUCED_EMPHASIS_PATTERN.match(markup)
-        if inner:
-            return Segment(text=inner.group(1), emphasis="reduced", emphasis_delimiter="~~")
-        return None
+def _tilde_emphasis_segment(markup: str, extensions: dict | None) -> Segment | None:
+    """Build a reduced emphasis segment from ~~text~~."""
+    return Segment(text=markup[2:-2], emphasis="reduced", emphasis_delimiter="~~")
 
-    if markup.startswith("_") and not markup.startswith("__"):
-        inner = REDUCED_EMPHASIS_PATTERN.match(markup)
-        if inner:
-            return Segment(text=inner.group(1), emphasis="reduced", emphasis_delimiter="_")
-        return None
 
-    if markup.startswith("["):
-        return _parse_annotation(markup, extensions)
+def _underscore_emphasis_segment(markup: str, extensions: dict | None) -> Segment | None:
+    """Build a reduced emphasis segment from _text_."""
+    return Segment(text=markup[1:-1], emphasis="reduced", emphasis_delimiter="_")
 
-    return None
 
+def _annotation_segment(markup: str, extensions: dict | None) -> Segment | None:
+    """Build a segment from [text]{key="value"} markup.
 
-def _apply_pending(
-    seg: Segment,
-    pending_breaks: list[BreakAttrs],
-    pending_marks: list[str],
-) -> None:
-    """Apply pending breaks and marks to a segment."""
-    if pending_breaks:
-        seg.breaks_before = pending_breaks.copy()
-    if pending_marks:
-        seg.marks_before = pending_marks.copy()
+    The annotation text cannot contain "]", so the first one closes it and the
+    params run up to the final "}" of the token.
+    """
+    close = markup.index("]")
+    return _annotation_from_parts(markup[1:close], markup[close + 2 : -1], extensions)
+
+
+_MarkupHandler = Callable[
+    [str, list[Segment], "_PendingMarkup", dict | None],
+    Segment | None,
+]
+
+# Markup token handlers keyed by the token's first character
+_MARKUP_DISPATCH: dict[str, _MarkupHandler] = {
+    ".": _handle_break_markup,
+    "@": _handle_mark_markup,
+}
+
+# Segment builders for emphasis and annotation tokens, keyed by first character
+_MARKUP_SEGMENT_BUILDERS: dict[str, Callable[[str, dict | None], Segment | None]] = {
+    "*": _star_emphasis_segment,
+    "~": _tilde_emphasis_segment,
+    "_": _underscore_emphasis_segment,
+    "[": _annotation_segment,
+}
+
+
+@dataclass(slots=True)
+class _PendingMarkup:
+    """Breaks and marks seen before the first segment they can attach to."""
+
+    breaks: list[BreakAttrs] = field(default_factory=list)
+    marks: list[str] = field(default_factory=list)
+
+    def apply_to(self, seg: Segment) -> None:
+        """Hand pending breaks and marks to seg and start fresh lists.
+
+        The lists are handed over rather than copied.
+        """
+        if self.breaks:
+            seg.breaks_before = self.breaks
+            self.breaks = []
+        if self.marks:
+            seg.marks_before = self.marks
+            self.marks = []
 
 
 def _parse_heading(
@@ -831,33 +1002,67 @@ def _parse_heading(
     if level not in heading_levels:
         return [Segment(text=text)]
 
-    # Build segment with heading effects
-    seg = Segment(text=text)
+    # Collect heading effects, then build the segment once
+    emphasis: bool | str = False
+    prosody: ProsodyAttrs | None = None
+    breaks_before: list[BreakAttrs] = []
+    breaks_after: list[BreakAttrs] = []
 
     for effect_type, value in heading_levels[level]:
         if effect_type == "emphasis":
-            seg.emphasis = value
+            emphasis = value
         elif effect_type == "pause":
-            seg.breaks_after.append(BreakAttrs(time=value))
+            breaks_after.append(BreakAttrs(time=value))
         elif effect_type == "pause_before":
-            seg.breaks_before.append(BreakAttrs(time=value))
+            breaks_before.append(BreakAttrs(time=value))
         elif effect_type == "prosody" and isinstance(value, dict):
-            seg.prosody = ProsodyAttrs(
+            prosody = ProsodyAttrs(
                 volume=value.get("volume"),
                 rate=value.get("rate"),
                 pitch=value.get("pitch"),
             )
 
-    return [seg]
+    return [
+        Segment(
+            text=text,
+            emphasis=emphasis,
+            prosody=prosody,
+            breaks_before=breaks_before,
+            breaks_after=breaks_after,
+        )
+    ]
+
+
+@dataclass(slots=True)
+class _CleanTextBuilder:
+    """Collects parse_spans clean text as pieces, tracking the running length.
+
+    Span offsets need the length so far after every segment; keeping pieces
+    avoids rebuilding the whole string for each appended segment.
+    """
+
+    parts: list[str] = field(default_factory=list)
+    length: int = 0
+
+    def append(self, text: str) -> None:
+        if text:
+            self.parts.append(text)
+            self.length += len(text)
+
+    def endswith_newline(self) -> bool:
+        return bool(self.parts) and self.parts[-1].endswith("\n")
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
 
 
 def _parse_block_to_spans(
-    clean_text: str,
+    clean_text: _CleanTextBuilder,
     block_text: str,
     annotations: list[AnnotationSpan],
     warnings: list[str],
     preserve_whitespace: bool,
-) -> str:
+) -> None:
     if preserve_whitespace:
         segments, seg_warnings = _parse_segments_for_spans(
             block_text,
@@ -865,44 +1070,50 @@ def _parse_block_to_spans(
         )
         warnings.extend(seg_warnings)
         for segment, attrs_override in segments:
-            clean_text = _append_segment_spans(
+            _append_segment_spans(
                 clean_text,
                 segment,
                 annotations,
                 "inline",
                 attrs_override=attrs_override,
             )
-        return clean_text
+        return
 
-    paragraphs = PARAGRAPH_PATTERN.split(block_text)
-    for para_index, paragraph in enumerate(paragraphs):
+    for para_index, paragraph in enumerate(_iter_paragraphs(block_text)):
         if not paragraph.strip():
             continue
 
-        if clean_text and (para_index > 0 or clean_text.endswith("\n")):
-            clean_text += "\n\n"
+        if clean_text.length and (para_index > 0 or clean_text.endswith_newline()):
+            clean_text.append("\n\n")
 
-        clean_text = _parse_paragraph_normalized(
+        _parse_paragraph_normalized(
             clean_text,
             paragraph,
             annotations,
             warnings,
         )
 
-    return clean_text
+
+def _iter_paragraphs(text: str) -> Iterator[str]:
+    """Yield the pieces of text between PARAGRAPH_PATTERN breaks, like split()."""
+    position = 0
+    for match in PARAGRAPH_PATTERN.finditer(text):
+        yield text[position : match.start()]
+        position = match.end()
+    yield text[position:]
 
 
 def _parse_paragraph_normalized(
-    clean_text: str,
+    clean_text: _CleanTextBuilder,
     paragraph: str,
     annotations: list[AnnotationSpan],
     warnings: list[str],
-) -> str:
+) -> None:
     segments, seg_warnings = _parse_segments_for_spans(paragraph)
     warnings.extend(seg_warnings)
 
     for segment, attrs_override in segments:
-        clean_text = _append_segment_spans_normalized(
+        _append_segment_spans_normalized(
             clean_text,
             segment,
             annotations,
@@ -910,23 +1121,21 @@ def _parse_paragraph_normalized(
             attrs_override=attrs_override,
         )
 
-    return clean_text
-
 
 def _append_segment_spans(
-    clean_text: str,
+    clean_text: _CleanTextBuilder,
     segment: Segment,
     annotations: list[AnnotationSpan],
     kind: str,
     attrs_override: dict[str, str] | None = None,
-) -> str:
+) -> None:
     text = segment.to_text()
     if not text:
-        return clean_text
+        return
 
-    char_start = len(clean_text)
-    clean_text += text
-    char_end = len(clean_text)
+    char_start = clean_text.length
+    clean_text.append(text)
+    char_end = clean_text.length
 
     attrs = attrs_override if attrs_override is not None else _segment_attrs_to_map(segment)
     if attrs:
@@ -939,28 +1148,25 @@ def _append_segment_spans(
             )
         )
 
-    return clean_text
-
 
 def _append_segment_spans_normalized(
-    clean_text: str,
+    clean_text: _CleanTextBuilder,
     segment: Segment,
     annotations: list[AnnotationSpan],
     kind: str,
     attrs_override: dict[str, str] | None = None,
-) -> str:
+) -> None:
     text = segment.to_text()
     if not text:
-        return clean_text
+        return
 
-    prefix = ""
-    if clean_text and not clean_text.endswith("\n"):
-        if text and not text.startswith(tuple(".!?,:;")):
-            prefix = " "
+    if clean_text.length and not clean_text.endswith_newline():
+        if text[0] not in _ATTACHING_PUNCTUATION:
+            clean_text.append(" ")
 
-    char_start = len(clean_text) + len(prefix)
-    clean_text = f"{clean_text}{prefix}{text}"
-    char_end = len(clean_text)
+    char_start = clean_text.length
+    clean_text.append(text)
+    char_end = clean_text.length
 
     attrs = attrs_override if attrs_override is not None else _segment_attrs_to_map(segment)
     if attrs:
@@ -973,8 +1179,6 @@ def _append_segment_spans_normalized(
             )
         )
 
-    return clean_text
-
 
 def _annotated_attrs_to_tagged(attrs: dict[str, str]) -> dict[str, str]:
     tag: str | None = None
@@ -992,7 +1196,7 @@ def _annotated_attrs_to_tagged(attrs: dict[str, str]) -> dict[str, str]:
         tag = "voice"
     elif "lang" in attrs:
         tag = "lang"
-    elif any(k in attrs for k in ("volume", "rate", "pitch", "v", "r", "p")):
+    elif not _PROSODY_PARAM_KEYS.isdisjoint(attrs):
         tag = "prosody"
     elif "emphasis" in attrs:
         tag = "emphasis"
@@ -1092,33 +1296,15 @@ def _parse_segments_for_spans(
         segments.extend((segment, _segment_attrs_to_map(segment)) for segment in parsed)
         return segments, warnings
 
-    combined = re.compile(
-        r"("
-        r"\*\*[^\*]+\*\*"
-        r"|\*[^\*]+\*"
-        r"|~~[^~]+~~"
-        r"|(?<![_a-zA-Z0-9])_(?!_)[^_]+?(?<!_)_(?![_a-zA-Z0-9])"
-        r"|\[[^\]]*\]\{(?:\\.|[^}])+\}"
-        r"|\.\.\.(?:\d+(?:\.\d+)?(?:s|ms)|[nwcsp])(?=\s|$|[.!?,;:])"
-        r"|(?<!\S)@(?!voice[:(])\w+(?=\s|$)"
-        r")"
-    )
+    pending = _PendingMarkup()
 
-    pending_breaks: list[BreakAttrs] = []
-    pending_marks: list[str] = []
-
-    for match in combined.finditer(text):
+    for match in INLINE_MARKUP_PATTERN.finditer(text):
         if match.start() > position:
             plain_text = text[position : match.start()]
             plain = _normalize_text(plain_text) if normalize_text else plain_text
             if plain:
                 seg = Segment(text=plain)
-                if pending_breaks:
-                    seg.breaks_before = pending_breaks
-                    pending_breaks = []
-                if pending_marks:
-                    seg.marks_before = pending_marks
-                    pending_marks = []
+                pending.apply_to(seg)
                 segments.append((seg, _segment_attrs_to_map(seg)))
 
         markup = match.group(0)
@@ -1134,13 +1320,7 @@ def _parse_segments_for_spans(
                 attrs_override = _annotated_attrs_to_tagged(attrs_override)
 
         current_segments = [segment for segment, _ in segments]
-        pending_breaks, pending_marks, markup_seg = _handle_markup(
-            markup,
-            current_segments,
-            pending_breaks,
-            pending_marks,
-            extensions=None,
-        )
+        markup_seg = _handle_markup(markup, current_segments, pending, extensions=None)
         if markup_seg:
             if attrs_override is None or not attrs_override:
                 attrs_override = _segment_attrs_to_map(markup_seg)
@@ -1153,14 +1333,14 @@ def _parse_segments_for_spans(
         plain = _normalize_text(plain_text) if normalize_text else plain_text
         if plain:
             seg = Segment(text=plain)
-            _apply_pending(seg, pending_breaks, pending_marks)
+            pending.apply_to(seg)
             segments.append((seg, _segment_attrs_to_map(seg)))
 
     if not segments and text.strip():
         content = _normalize_text(text) if normalize_text else text
         if content:
             seg = Segment(text=content)
-            _apply_pending(seg, pending_breaks, pending_marks)
+            pending.apply_to(seg)
             segments.append((seg, _segment_attrs_to_map(seg)))
 
     if text.count("[") != text.count("]"):
@@ -1200,77 +1380,65 @@ def _directive_attrs_to_map(directive: DirectiveAttrs) -> dict[str, str]:
 
 def _parse_break(modifier: str) -> BreakAttrs:
     """Parse break modifier into BreakAttrs."""
-    if modifier in SSMD_BREAK_MARKER_TO_STRENGTH:
-        return BreakAttrs(strength=SSMD_BREAK_MARKER_TO_STRENGTH[modifier])
-    elif modifier.endswith("s") or modifier.endswith("ms"):
+    strength = SSMD_BREAK_MARKER_TO_STRENGTH.get(modifier)
+    if strength is not None:
+        return BreakAttrs(strength=strength)
+    # "s" covers both "2s" and "500ms"
+    if modifier.endswith("s"):
         return BreakAttrs(time=modifier)
-    else:
-        return BreakAttrs(time=f"{modifier}ms")
-
+    return BreakAttrs(time=f"{modifier}ms")
 
-def _parse_annotation(markup: str, extensions: dict | None = None) -> Segment | None:
-    """Parse [text]{key="value"} markup."""
-    match = ANNOTATION_PATTERN.match(markup)
-    if not match:
-        return None
 
-    text = match.group(1)
-    params = match.group(2).strip()
-
-    seg = Segment(text=text)
-    params_map = _parse_annotation_params(params)
-    if not params_map and params:
-        return seg
+def _annotation_from_parts(text: str, params: str, extensions: dict | None) -> Segment:
+    """Build a segment from annotation text and its raw params string.
 
+    All attributes are resolved first so the segment is constructed once.
+    """
+    params_map = _parse_annotation_params(params.strip())
     if not params_map:
-        return seg
+        return Segment(text=text)
 
     if "src" in params_map:
-        seg.audio = _parse_audio_annotation_params(params_map)
-        return seg
+        return Segment(text=text, audio=_parse_audio_annotation_params(params_map))
 
+    language: str | None
     if "lang" in params_map:
-        seg.language = params_map["lang"]
-    elif "language" in params_map:
-        seg.language = params_map["language"]
-
-    voice = _parse_voice_annotation_params(params_map)
-    if voice:
-        seg.voice = voice
-
-    say_as = _parse_say_as_params(params_map)
-    if say_as:
-        seg.say_as = say_as
-
-    phoneme = _parse_phoneme_params(params_map)
-    if phoneme:
-        seg.phoneme = phoneme
-
-    if "sub" in params_map:
-        seg.substitution = params_map["sub"]
+        language = params_map["lang"]
+    else:
+        language = params_map.get("language")
 
+    emphasis: bool | str = False
     if "emphasis" in params_map:
         level = params_map["emphasis"].lower()
         if level in ("none", "reduced", "moderate", "strong"):
-            seg.emphasis = level if level != "moderate" else True
-
-    if "ext" in params_map:
-        seg.extension = params_map["ext"]
+            emphasis = level if level != "moderate" else True
 
-    prosody = _parse_prosody_params(params_map)
-    if prosody:
-        seg.prosody = prosody
-
-    return seg
+    return Segment(
+        text=text,
+        emphasis=emphasis,
+        prosody=_parse_prosody_params(params_map),
+        language=language,
+        voice=_parse_voice_annotation_params(params_map),
+        say_as=_parse_say_as_params(params_map),
+        substitution=params_map.get("sub"),
+        phoneme=_parse_phoneme_params(params_map),
+        extension=params_map.get("ext"),
+    )
 
 
 def _parse_annotation_params(params: str) -> dict[str, str]:
     """Parse key="value" pairs from annotation params."""
+    return _parse_annotation_params_cached(params).copy()
+
+
+@lru_cache(maxsize=1024)
+def _parse_annotation_params_cached(params: str) -> dict[str, str]:
+    """Parse annotation params once per distinct string; callers get a copy."""
     values, _ = _parse_annotation_params_with_warnings(params)
     return values
 
 
-def _parse_annotation_params_with_warnings(  # noqa: C901
+def _parse_annotation_params_with_warnings(
     params: str,
 ) -> tuple[dict[str, str], list[str]]:
     values: dict[str, str] = {}
@@ -1280,117 +1448,134 @@ def _parse_annotation_params_with_warnings(  # noqa: C901
         return values, warnings
 
     key = ""
-    value = ""
-    state = "key"
-    quote: str | None = None
-    escape = False
-
-    def _commit() -> None:
-        nonlocal key, value
-        if key:
-            values[key.lower()] = value
-        key = ""
-        value = ""
-
-    for ch in params:
-        if state == "key":
-            if ch.isspace():
-                continue
-            if ch == "=":
-                if key:
-                    state = "value"
-                continue
-            if ch.isalnum() or ch in "_-:":
+    index = 0
+    length = len(params)
+
+    while index < length:
+        ch = params[index]
+        index += 1
+        if ch == "=":
+            if key:
+                # Fast path: key="value" with no escapes inside the quotes
+                quote = params[index : index + 1]
+                if quote == '"' or quote == "'":
+                    close = params.find(quote, index + 1)
+                    if close != -1 and params.find("\\", index + 1, close) == -1:
+                        values[key.lower()] = params[index + 1 : close]
+                        key = ""
+                        index = close + 1
+                        continue
+                index, value, terminated = _scan_annotation_value(params, index)
+                values[key.lower()] = value
+                key = ""
+                if not terminated:
+                    warnings.append("Unterminated quote in annotation attributes.")
+                    return values, warnings
+            continue
+        if ch.isspace():
+            continue
+        if ch.isalnum() or ch in "_-:":
+            # Take the whole key up to "=" at once when it is well formed
+            end = params.find("=", index)
+            if end == -1:
+                end = length
+            run = params[index - 1 : end]
+            if run.isalnum() or run.translate(_ANNOTATION_KEY_PUNCTUATION).isalnum():
+                key += run
+                index = end
+            else:
                 key += ch
-                continue
-            warnings.append(f"Unexpected character '{ch}' in attribute key.")
             continue
+        warnings.append(f"Unexpected character '{ch}' in attribute key.")
 
-        if state == "value":
-            if quote:
-                # Handle escaping within quoted strings
-                if escape:
-                    value += ch
-                    escape = False
-                    continue
+    if key:
+        values[key.lower()] = ""
 
-                if ch == "\\":
-                    escape = True
-                    continue
+    return values, warnings
 
-                if ch == quote:
-                    _commit()
-                    state = "key"
-                    quote = None
-                else:
-                    value += ch
-                continue
 
-            if ch in ('"', "'"):
-                quote = ch
-                continue
+def _scan_annotation_value(params: str, index: int) -> tuple[int, str, bool]:
+    """Scan one attribute value starting at ``index``.
 
-            if ch.isspace() and value != "":
-                _commit()
-                state = "key"
-                continue
-            elif ch.isspace() and value == "":
-                continue
+    Unquoted runs and quoted runs are copied as slices rather than character
+    by character. A closing quote or whitespace after a non-empty value ends
+    it; leading whitespace is skipped.
 
-            value += ch
+    Returns:
+        Tuple of (next index, value, False if a quote was left open)
+    """
+    length = len(params)
+    parts: list[str] = []
 
-    if quote is not None:
-        warnings.append("Unterminated quote in annotation attributes.")
-        if key:
-            values[key.lower()] = value
-        return values, warnings
+    while index < length:
+        ch = params[index]
+
+        if ch == '"' or ch == "'":
+            index += 1
+            while True:
+                close = params.find(ch, index)
+                backslash = params.find("\\", index, length if close == -1 else close)
+                if backslash != -1:
+                    # Keep the escaped character, drop the backslash
+                    parts.append(params[index:backslash])
+                    parts.append(params[backslash + 1 : backslash + 2])
+                    index = min(backslash + 2, length)
+                    continue
+                if close == -1:
+                    parts.append(params[index:])
+                    return length, "".join(parts), False
+                parts.append(params[index:close])
+                return close + 1, "".join(parts), True
+
+        if ch.isspace():
+            index += 1
+            if parts:
+                break
+            continue
 
-    if key:
-        if state == "value" and quote is None:
-            _commit()
-        elif state == "key":
-            values[key.lower()] = ""
+        start = index
+        while index < length:
+            ch = params[index]
+            if ch.isspace() or ch == '"' or ch == "'":
+                break
+            index += 1
+        parts.append(params[start:index])
 
-    return values, warnings
+    return index, "".join(parts), True
 
 
 def _parse_audio_annotation_params(params_map: dict[str, str]) -> AudioAttrs:
     """Parse audio parameters from annotation map."""
-    audio = AudioAttrs(src=params_map["src"])
-
+    clip_begin = clip_end = None
     clip = params_map.get("clip")
     if clip and "-" in clip:
         clip_begin, clip_end = clip.split("-", 1)
-        audio.clip_begin = clip_begin.strip()
-        audio.clip_end = clip_end.strip()
-
-    if params_map.get("speed"):
-        audio.speed = params_map["speed"]
+        clip_begin = clip_begin.strip()
+        clip_end = clip_end.strip()
 
+    repeat_count = None
     repeat = params_map.get("repeat")
     if repeat:
         try:
-            audio.repeat_count = int(repeat)
+            repeat_count = int(repeat)
         except ValueError:
             pass
 
-    if params_map.get("repeatdur"):
-        audio.repeat_dur = params_map["repeatdur"]
-
-    if params_map.get("level"):
-        audio.sound_level = params_map["level"]
-
-    if params_map.get("alt"):
-        audio.alt_text = params_map["alt"]
-
-    return audio
+    return AudioAttrs(
+        src=params_map["src"],
+        alt_text=params_map.get("alt") or None,
+        clip_begin=clip_begin,
+        clip_end=clip_end,
+        speed=params_map.get("speed") or None,
+        repeat_count=repeat_count,
+        repeat_dur=params_map.get("repeatdur") or None,
+        sound_level=params_map.get("level") or None,
+    )
 
 
 def _parse_voice_annotation_params(params_map: dict[str, str]) -> VoiceAttrs | None:
     """Parse voice params from annotation map."""
-    if not any(
-        key in params_map for key in ("voice", "voice-lang", "voice_lang", "gender", "variant")
-    ):
+    if _VOICE_PARAM_KEYS.isdisjoint(params_map):
         return None
 
     voice = VoiceAttrs()
@@ -1404,7 +1589,11 @@ def _parse_voice_annotation_params(params_map: dict[str, str]) -> VoiceAttrs | N
         voice.language = voice_lang
 
     if "gender" in params_map:
-        voice.gender = params_map["gender"].lower()  # type: ignore[assignment]
+        gender = params_map["gender"].lower()
+        # Known genders share one string object across all parsed voices
+        if gender in _VOICE_GENDERS:
+            gender = sys.intern(gender)
+        voice.gender = gender  # type: ignore[assignment]
 
     if "variant" in params_map:
         try:
@@ -1447,73 +1636,56 @@ def _parse_phoneme_params(params_map: dict[str, str]) -> PhonemeAttrs | None:
 
 def _parse_prosody_params(params_map: dict[str, str]) -> ProsodyAttrs | None:
     """Parse prosody params from annotation map."""
+    if _PROSODY_PARAM_KEYS.isdisjoint(params_map):
+        return None
+
     volume = params_map.get("volume") or params_map.get("v")
     rate = params_map.get("rate") or params_map.get("r")
     pitch = params_map.get("pitch") or params_map.get("p")
 
-    if not any([volume, rate, pitch]):
+    if not (volume or rate or pitch):
         return None
 
-    prosody = ProsodyAttrs()
+    # Segments own their prosody objects and may clear fields later, so only
+    # the normalized values are shared between calls.
+    return ProsodyAttrs(*_normalize_prosody_values(volume, rate, pitch))
+
 
+@lru_cache(maxsize=1024)
+def _normalize_prosody_values(
+    volume: str | None, rate: str | None, pitch: str | None
+) -> tuple[str | None, str | None, str | None]:
+    """Normalize a volume/rate/pitch triple, caching repeated combinations."""
+    volume_level = rate_level = pitch_level = None
     if volume:
-        prosody.volume = _normalize_prosody_value(volume, PROSODY_VOLUME_MAP)
+        volume_level = _normalize_prosody_value(volume, PROSODY_VOLUME_MAP, _PROSODY_VOLUME_LEVELS)
     if rate:
-        prosody.rate = _normalize_prosody_value(rate, PROSODY_RATE_MAP)
+        rate_level = _normalize_prosody_value(rate, PROSODY_RATE_MAP, _PROSODY_RATE_LEVELS)
     if pitch:
-        prosody.pitch = _normalize_prosody_value(pitch, PROSODY_PITCH_MAP)
+        pitch_level = _normalize_prosody_value(pitch, PROSODY_PITCH_MAP, _PROSODY_PITCH_LEVELS)
+    return volume_level, rate_level, pitch_level
 
-    return prosody
 
+# Named prosody levels, for membership tests without scanning map values
+_PROSODY_VOLUME_LEVELS = frozenset(PROSODY_VOLUME_MAP.values())
+_PROSODY_RATE_LEVELS = frozenset(PROSODY_RATE_MAP.values())
+_PROSODY_PITCH_LEVELS = frozenset(PROSODY_PITCH_MAP.values())
 
-def _normalize_prosody_value(value: str, mapping: dict[str, str]) -> str:
+
+def _normalize_prosody_value(value: str, mapping: dict[str, str], levels: frozenset[str]) -> str:
     """Normalize prosody values to named levels where possible."""
     stripped = value.strip()
     if stripped.isdigit() and stripped in mapping:
         return mapping[stripped]
 
     lowered = stripped.lower()
-    if lowered in mapping.values():
-        return lowered
+    if lowered in levels:
+        # Named levels are a small fixed set, so every annotation shares one copy
+        return sys.intern(lowered)
 
     return stripped
 
 
-def _is_language_code(value: str) -> bool:
-    return bool(re.match(r"^[a-z]{2}(-[A-Z]{2})?$", value))
-
-
-def _parse_voice_annotation(params: str) -> VoiceAttrs:
-    """Parse voice annotation parameters."""
-    voice = VoiceAttrs()
-
-    # Check for complex params (with gender/variant)
-    if "," in params:
-        parts = [p.strip() for p in params.split(",")]
-        first = parts[0]
-
-        # First part is name or language
-        if re.match(r"^[a-z]{2}(-[A-Z]{2})?$", first):
-            voice.language = first
-        else:
-            voice.name = first
-
-        # Parse remaining parts
-        for part in parts[1:]:
-            if part.startswith("gender:"):
-                voice.gender = part[7:].strip().lower()  # type: ignore[assignment]
-            elif part.startswith("variant:"):
-                voice.variant = int(part[8:].strip())
-    else:
-        # Simple name or language
-        if re.match(r"^[a-z]{2}(-[A-Z]{2})?$", params):
-            voice.language = params
-        else:
-            voice.name = params
-
-    return voice
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # BACKWARD COMPATIBILITY
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1563,27 +1735,92 @@ def parse_sentences(
     Returns:
         List of Sentence objects
     """
-    paragraphs = parse_paragraphs(
+    paragraphs, diagnostics = _paragraph_stream(
         ssmd_text,
         capabilities=capabilities,
+        heading_levels=heading_levels,
+        extensions=extensions,
         sentence_detection=sentence_detection,
         language=language,
-        model_size=model_size,
-        spacy_model=spacy_model,
         use_spacy=use_spacy,
+        spacy_model=spacy_model,
+        model_size=model_size,
+        parse_yaml_header=parse_yaml_header,
+        strict_parse=strict_parse,
+    )
+    return ParsedResult(
+        _iter_paragraph_sentences(paragraphs, include_default_voice),
+        diagnostics=diagnostics,
+    )
+
+
+def iter_sentences(
+    ssmd_text: str,
+    *,
+    capabilities: "TTSCapabilities | str | None" = None,
+    include_default_voice: bool = True,
+    sentence_detection: bool = True,
+    language: str | None = None,
+    model_size: SpacyModelSize | None = None,
+    spacy_model: str | None = None,
+    use_spacy: bool | None = None,
+    heading_levels: dict | None = None,
+    extensions: dict | None = None,
+    parse_yaml_header: bool = True,
+    strict_parse: bool = False,
+) -> Iterator[Sentence]:
+    """Parse SSMD text and yield sentences as each paragraph is parsed.
+
+    Streaming counterpart of parse_sentences(). Sentence detection is set up
+    once, then each paragraph is split and parsed only when the iterator
+    reaches it, so a consumer can start on the first sentences before the
+    rest of the text has been parsed. Use parse_sentences() when sentence
+    detection diagnostics are needed.
+
+    Args:
+        ssmd_text: SSMD formatted text to parse
+        capabilities: TTS capabilities or preset name
+        include_default_voice: If False, skip sentences without voice context
+        sentence_detection: Enable/disable sentence splitting
+        language: Language code for sentence detection
+        model_size: Size of spacy model (sm/md/lg)
+        spacy_model: Full spacy model name
+        use_spacy: Force use of spacy for sentence detection
+        heading_levels: Custom heading configurations
+        extensions: Custom extension handlers
+        parse_yaml_header: If True, parse YAML front matter and apply
+            heading/extensions config while stripping it from the body. If False,
+            YAML front matter is preserved as plain text.
+        strict_parse: If True, strip unsupported features based on capabilities.
+
+    Yields:
+        Sentence objects in document order, with the same paragraph_index and
+        sentence_index metadata as parse_sentences()
+    """
+    paragraphs, _ = _paragraph_stream(
+        ssmd_text,
+        capabilities=capabilities,
         heading_levels=heading_levels,
         extensions=extensions,
+        sentence_detection=sentence_detection,
+        language=language,
+        use_spacy=use_spacy,
+        spacy_model=spacy_model,
+        model_size=model_size,
         parse_yaml_header=parse_yaml_header,
         strict_parse=strict_parse,
     )
+    yield from _iter_paragraph_sentences(paragraphs, include_default_voice)
 
-    sentences = [sentence for paragraph in paragraphs for sentence in paragraph.sentences]
 
-    # Filter out sentences without voice if requested
-    if not include_default_voice:
-        sentences = [s for s in sentences if s.voice is not None]
-
-    return ParsedResult(sentences, diagnostics=paragraphs.diagnostics)
+def _iter_paragraph_sentences(
+    paragraphs: Iterator[Paragraph], include_default_voice: bool
+) -> Iterator[Sentence]:
+    """Flatten paragraphs into sentences, optionally skipping unvoiced ones."""
+    for paragraph in paragraphs:
+        for sentence in paragraph.sentences:
+            if include_default_voice or sentence.voice is not None:
+                yield sentence
 
 
 def parse_segments(
@@ -1651,17 +1888,17 @@ def parse_spans(
     blocks, directive_warnings = _split_directive_blocks_with_warnings(text)
     warnings.extend(directive_warnings)
 
-    clean_text = ""
+    builder = _CleanTextBuilder()
     for directive, block_text in blocks:
-        block_start = len(clean_text)
-        clean_text = _parse_block_to_spans(
-            clean_text,
+        block_start = builder.length
+        _parse_block_to_spans(
+            builder,
             block_text,
             annotations,
             warnings,
             preserve_whitespace=not normalize,
         )
-        block_end = len(clean_text)
+        block_end = builder.length
 
         directive_attrs = _directive_attrs_to_map(directive)
         if directive_attrs and block_end > block_start:
@@ -1676,7 +1913,7 @@ def parse_spans(
                 )
             )
 
-    clean_text = unescape_ssmd_syntax(clean_text)
+    clean_text = unescape_ssmd_syntax(builder.getvalue())
 
     if default_lang and clean_text:
         annotations.insert(
@@ -7,7 +7,7 @@ attributes. Segments are combined to form sentences.
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ssmd.ssml_conversions import PROSODY_PITCH_MAP as PITCH_MAP
 from ssmd.ssml_conversions import PROSODY_RATE_MAP as RATE_MAP
@@ -177,7 +177,60 @@ def expand_language_code(code: str) -> str:
     return code
 
 
-@dataclass
+def _voice_to_ssmd_pairs(voice: VoiceAttrs) -> list[tuple[str, str]]:
+    """Convert voice to annotation pairs."""
+    pairs: list[tuple[str, str]] = []
+    if voice.name:
+        pairs.append(("voice", voice.name))
+    if voice.language:
+        pairs.append(("voice-lang", voice.language))
+    if voice.gender:
+        pairs.append(("gender", voice.gender))
+    if voice.variant is not None:
+        pairs.append(("variant", str(voice.variant)))
+    return pairs
+
+
+def _say_as_to_ssmd_pairs(say_as: SayAsAttrs) -> list[tuple[str, str]]:
+    """Convert say-as to annotation pairs."""
+    pairs: list[tuple[str, str]] = [("as", say_as.interpret_as)]
+    if say_as.format:
+        pairs.append(("format", say_as.format))
+    if say_as.detail:
+        pairs.append(("detail", say_as.detail))
+    return pairs
+
+
+def _phoneme_to_ssmd_pairs(phoneme: PhonemeAttrs) -> list[tuple[str, str]]:
+    """Convert phoneme to annotation pairs."""
+    return [("ph", phoneme.ph), ("alphabet", phoneme.alphabet)]
+
+
+def _prosody_to_ssmd_pairs(prosody: ProsodyAttrs) -> list[tuple[str, str]]:
+    """Convert prosody to annotation pairs."""
+    pairs: list[tuple[str, str]] = []
+    if prosody.volume:
+        pairs.append(("volume", prosody.volume))
+    if prosody.rate:
+        pairs.append(("rate", prosody.rate))
+    if prosody.pitch:
+        pairs.append(("pitch", prosody.pitch))
+    return pairs
+
+
+# Annotation builders for Segment.to_ssmd(), in output order: (attribute, builder)
+_SSMD_ANNOTATION_BUILDERS: tuple[tuple[str, Callable[[Any], list[tuple[str, str]]]], ...] = (
+    ("language", lambda language: [("lang", language)]),
+    ("voice", _voice_to_ssmd_pairs),
+    ("say_as", _say_as_to_ssmd_pairs),
+    ("substitution", lambda substitution: [("sub", substitution)]),
+    ("phoneme", _phoneme_to_ssmd_pairs),
+    ("extension", lambda extension: [("ext", extension)]),
+    ("prosody", _prosody_to_ssmd_pairs),
+)
+
+
+@dataclass(slots=True)
 class Segment:
     """A segment of text with SSMD features.
 
@@ -522,31 +575,20 @@ class Segment:
         Returns:
             SSMD string
         """
-        result = ""
-
-        # Add marks before
-        for mark in self.marks_before:
-            result += f"@{mark} "
-
-        # Add breaks before
-        for brk in self.breaks_before:
-            result += self._break_to_ssmd(brk) + " "
-
-        # Build content
         content = self._build_content_ssmd()
-        result += content
-
-        # Add breaks after
-        for brk in self.breaks_after:
-            result += " " + self._break_to_ssmd(brk)
-
-        # Add marks after
-        for mark in self.marks_after:
-            result += f" @{mark}"
-
-        return result
-
-    def _build_content_ssmd(self) -> str:  # noqa: C901
+        if not (self.marks_before or self.breaks_before or self.breaks_after or self.marks_after):
+            return content
+
+        # Marks and breaks are space-separated around the content; collect every
+        # piece first so the result string is built once.
+        parts = [f"@{mark}" for mark in self.marks_before]
+        parts.extend([self._break_to_ssmd(brk) for brk in self.breaks_before])
+        parts.append(content)
+        parts.extend([self._break_to_ssmd(brk) for brk in self.breaks_after])
+        parts.extend([f"@{mark}" for mark in self.marks_after])
+        return " ".join(parts)
+
+    def _build_content_ssmd(self) -> str:
         """Build SSMD content with markup."""
         text = self.text
 
@@ -555,32 +597,10 @@ class Segment:
             return self._audio_to_ssmd(self.audio)
 
         annotations: list[tuple[str, str]] = []
-
-        if self.language:
-            annotations.append(("lang", self.language))
-
-        if self.voice:
-            annotations.extend(self._voice_to_ssmd_pairs(self.voice))
-
-        if self.say_as:
-            annotations.append(("as", self.say_as.interpret_as))
-            if self.say_as.format:
-                annotations.append(("format", self.say_as.format))
-            if self.say_as.detail:
-                annotations.append(("detail", self.say_as.detail))
-
-        if self.substitution:
-            annotations.append(("sub", self.substitution))
-
-        if self.phoneme:
-            annotations.append(("ph", self.phoneme.ph))
-            annotations.append(("alphabet", self.phoneme.alphabet))
-
-        if self.extension:
-            annotations.append(("ext", self.extension))
-
-        if self.prosody:
-            annotations.extend(self._prosody_to_ssmd_pairs(self.prosody))
+        for attr_name, build_pairs in _SSMD_ANNOTATION_BUILDERS:
+            value = getattr(self, attr_name)
+            if value:
+                annotations.extend(build_pairs(value))
 
         if self.emphasis:
             if self.emphasis == "none":
@@ -604,34 +624,6 @@ class Segment:
         """Format annotation key/value pairs."""
         return " ".join([format_ssmd_attr(key, value) for key, value in pairs])
 
-    def _prosody_to_ssmd_pairs(self, prosody: ProsodyAttrs) -> list[tuple[str, str]]:
-        """Convert prosody to annotation pairs."""
-        pairs: list[tuple[str, str]] = []
-
-        if prosody.volume:
-            pairs.append(("volume", prosody.volume))
-
-        if prosody.rate:
-            pairs.append(("rate", prosody.rate))
-
-        if prosody.pitch:
-            pairs.append(("pitch", prosody.pitch))
-
-        return pairs
-
-    def _voice_to_ssmd_pairs(self, voice: VoiceAttrs) -> list[tuple[str, str]]:
-        """Convert voice to annotation pairs."""
-        pairs: list[tuple[str, str]] = []
-        if voice.name:
-            pairs.append(("voice", voice.name))
-        if voice.language:
-            pairs.append(("voice-lang", voice.language))
-        if voice.gender:
-            pairs.append(("gender", voice.gender))
-        if voice.variant is not None:
-            pairs.append(("variant", str(voice.variant)))
-        return pairs
-
     def _audio_to_ssmd(self, audio: AudioAttrs) -> str:
         """Convert audio to SSMD format."""
         pairs: list[tuple[str, str]] = [("src", audio.src)]
@@ -4,6 +4,7 @@ A Sentence represents a logical unit of speech that should be spoken together.
 Sentences contain segments and have an optional voice context.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
@@ -14,8 +15,11 @@ from ssmd.types import BreakAttrs, ProsodyAttrs, VoiceAttrs
 if TYPE_CHECKING:
     from ssmd.capabilities import TTSCapabilities
 
+# Parts starting with these characters attach to the previous part without a space
+_ATTACHED_PART_PATTERN = re.compile(r'[.!?,;:\'")\]}>]')
 
-@dataclass
+
+@dataclass(slots=True)
 class Sentence:
     """A sentence containing segments with directive context.
 
@@ -102,28 +106,27 @@ class Sentence:
         Returns:
             Joined SSML string
         """
-        import re
-
         if not parts:
             return ""
 
-        result = parts[0]
-        for i in range(1, len(parts)):
-            part = parts[i]
+        pieces = [parts[0]]
+        last_char = parts[0][-1:]
+        for part in parts[1:]:
             # Don't add space before punctuation or if part starts with <break
             if part and (
-                re.match(r'^[.!?,;:\'")\]}>]', part)
-                or part.startswith("<break")
-                or part.startswith("<mark")
+                _ATTACHED_PART_PATTERN.match(part) or part.startswith(("<break", "<mark"))
             ):
-                result += part
+                pieces.append(part)
             # Don't add space if previous part ends with opening bracket/quote
-            elif result and result[-1] in "([{<\"'":
-                result += part
+            elif last_char and last_char in "([{<\"'":
+                pieces.append(part)
             else:
-                result += " " + part
+                part = " " + part
+                pieces.append(part)
+            if part:
+                last_char = part[-1]
 
-        return result
+        return "".join(pieces)
 
     def _wrap_directives(
         self,
@@ -237,8 +240,6 @@ class Sentence:
         Returns:
             Joined text string
         """
-        import re
-
         if not parts:
             return ""
 
@@ -247,19 +248,20 @@ class Sentence:
         if not parts:
             return ""
 
-        result = parts[0]
-        for i in range(1, len(parts)):
-            part = parts[i]
+        pieces = [parts[0]]
+        last_char = parts[0][-1]
+        for part in parts[1:]:
             # Don't add space before punctuation
-            if part and re.match(r'^[.!?,;:\'")\]}>]', part):
-                result += part
+            if _ATTACHED_PART_PATTERN.match(part):
+                pieces.append(part)
             # Don't add space if previous part ends with opening bracket/quote
-            elif result and result[-1] in "([{<\"'":
-                result += part
+            elif last_char in "([{<\"'":
+                pieces.append(part)
             else:
-                result += " " + part
+                pieces.append(" " + part)
+            last_char = part[-1]
 
-        return result
+        return "".join(pieces)
 
     @property
     def text(self) -> str:
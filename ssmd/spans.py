@@ -29,7 +29,7 @@ class Diagnostic:
     column: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnnotationSpan:
     char_start: int
     char_end: int
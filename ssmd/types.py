@@ -58,7 +58,7 @@ class ParsedResult(list[T], Generic[T]):
         self.diagnostics = diagnostics
 
 
-@dataclass
+@dataclass(slots=True)
 class VoiceAttrs:
     """Voice attributes for TTS voice selection.
 
@@ -75,7 +75,7 @@ class VoiceAttrs:
     variant: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProsodyAttrs:
     """Prosody attributes for volume, rate, and pitch control.
 
@@ -93,7 +93,7 @@ class ProsodyAttrs:
     pitch: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectiveAttrs:
     """Directive attributes that apply to a <div> block.
 
@@ -108,7 +108,7 @@ class DirectiveAttrs:
     prosody: ProsodyAttrs | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BreakAttrs:
     """Break/pause attributes.
 
@@ -121,7 +121,7 @@ class BreakAttrs:
     strength: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SayAsAttrs:
     """Say-as attributes for text interpretation.
 
@@ -137,7 +137,7 @@ class SayAsAttrs:
     detail: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioAttrs:
     """Audio file attributes.
 
@@ -162,7 +162,7 @@ class AudioAttrs:
     sound_level: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PhonemeAttrs:
     """Phoneme pronunciation attributes.
 
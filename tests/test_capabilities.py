@@ -160,6 +160,13 @@ def test_preset_lookup_returns_isolated_objects():
     assert second.emphasis is False
 
 
+def test_parser_preset_lookup_is_shared_and_leaves_get_preset_isolated():
+    from ssmd.parser import _resolve_capabilities
+
+    assert _resolve_capabilities("minimal") is _resolve_capabilities("minimal")
+    assert get_preset("minimal") is not _resolve_capabilities("minimal")
+
+
 def test_profile_lookup_returns_isolated_objects():
     first = ssmd.get_profile("ssmd-core")
     first.inline_tags.clear()
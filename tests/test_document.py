@@ -173,6 +173,15 @@ Goodbye now.
         ssml2 = doc.to_ssml()
         assert ssml1 != ssml2
 
+    def test_ssmd_export_caching(self):
+        """Test that formatted SSMD is cached until the document changes."""
+        doc = Document("Hello *big* world.")
+        ssmd1 = doc.to_ssmd()
+        assert doc.to_ssmd() is ssmd1
+
+        doc.add(" Goodbye.")
+        assert doc.to_ssmd() == "Hello *big* world.\nGoodbye."
+
 
 class TestDocumentListInterface:
     """Test list-like interface for documents."""
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ssmd.formatter import _format_breaks, format_source, format_ssmd
+from ssmd.formatter import _format_breaks, _format_segment, format_source, format_ssmd
 from ssmd.parser import parse_sentences
 from ssmd.parser_types import BreakAttrs, SSMDSegment, SSMDSentence
 
@@ -171,6 +171,16 @@ class TestFormatSSMD:
         paragraphs = formatted.strip().split("\n\n")
         assert len(paragraphs) == 3
 
+    def test_directive_blocks_never_emit_double_blank_lines(self):
+        """Paragraph and directive separators collapse to a single blank line."""
+        text = '<div voice="sarah">\nHello.\n\nWorld.\n</div>\n\nAfter.'
+        sentences = parse_sentences(text)
+
+        formatted = format_ssmd(sentences)
+
+        assert formatted == '<div voice="sarah">\nHello.\n\nWorld.\n\n</div>\n\nAfter.\n'
+        assert "\n\n\n" not in formatted
+
     def test_complex_text_with_quotes(self):
         """Quoted text with multiple sentences."""
         text = '"Hello there. How are you?" he asked.'
@@ -246,6 +256,20 @@ class TestFormatBreaks:
         assert "...500ms" in result
 
 
+class TestFormatSegment:
+    """Test the _format_segment() helper function."""
+
+    def test_plain_segment_matches_to_ssmd(self):
+        """Plain segments render as their text without markup assembly."""
+        segment = SSMDSegment(text="plain words")
+        assert _format_segment(segment) == segment.to_ssmd() == "plain words"
+
+    def test_marked_up_segment_uses_to_ssmd(self):
+        """Segments with any markup still go through to_ssmd()."""
+        segment = SSMDSegment(text="loud", emphasis="strong", marks_after=["m"])
+        assert _format_segment(segment) == segment.to_ssmd() == "**loud** @m"
+
+
 class TestRoundTrip:
     """Test parse → format → parse round trips."""
 
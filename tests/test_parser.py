@@ -3,6 +3,7 @@
 import pytest
 
 from ssmd import (
+    iter_sentences,
     iter_sentences_spans,
     parse_paragraphs,
     parse_segments,
@@ -139,6 +140,16 @@ Hello world
         assert directive.prosody.volume == "x-loud"
         assert directive.prosody.rate == "slow"
 
+    def test_directive_tags_must_stand_alone_on_their_line(self):
+        """Inline tags stay text; indented tags with trailing whitespace still count."""
+        text = 'Say <div voice="x"> here\n  <div voice="sarah">\t\nHello\n</div>\nBye'
+        blocks = parse_voice_blocks(text)
+
+        assert [block[1] for block in blocks] == ['Say <div voice="x"> here', "Hello", "Bye"]
+        assert blocks[0][0].voice is None
+        assert blocks[1][0].voice.name == "sarah"
+        assert blocks[2][0].voice is None
+
 
 class TestParseSegments:
     """Test segment parsing."""
@@ -151,6 +162,12 @@ class TestParseSegments:
         assert segments[0].text == "Hello world"
         assert segments[0].emphasis is False
 
+    def test_plain_text_whitespace_normalized(self):
+        """Whitespace runs collapse and spaces before punctuation are dropped."""
+        segments = parse_segments("Hello \t world ,  again !")
+
+        assert [s.text for s in segments] == ["Hello world, again!"]
+
     def test_emphasis(self):
         """Test parsing emphasis."""
         segments = parse_segments("Hello *world*")
@@ -247,6 +264,30 @@ class TestParseSegments:
         assert prosody_seg.prosody is not None
         assert prosody_seg.prosody.volume == "x-loud"
 
+    def test_repeated_prosody_annotations_get_independent_attrs(self):
+        """Repeated annotation params must not share mutable prosody objects."""
+        segments = parse_segments('[one]{volume="5"} and [two]{volume="5"}')
+
+        first, second = (s for s in segments if s.prosody)
+        first.prosody.volume = None
+
+        assert second.prosody.volume == "x-loud"
+        assert parse_segments('[three]{volume="5"}')[0].prosody.volume == "x-loud"
+
+    def test_named_levels_and_genders_share_one_string(self):
+        """Known level and gender values are interned across different annotations."""
+        segments = parse_segments(
+            '[a]{volume="LOUD"} [b]{rate="fast" volume="loud"} '
+            '[c]{gender="Female"} [d]{voice="x" gender="female"} [e]{gender="Robot"}'
+        )
+
+        a, b, c, d, e = segments
+        assert a.prosody.volume == "loud"
+        assert a.prosody.volume is b.prosody.volume
+        assert c.voice.gender == "female"
+        assert c.voice.gender is d.voice.gender
+        assert e.voice.gender == "robot"
+
     def test_language_annotation(self):
         """Test parsing language annotation."""
         segments = parse_segments('[Bonjour]{lang="fr"} everyone')
@@ -423,6 +464,23 @@ Sarah speaks
         # Should skip intro text
         assert all(s.voice is not None for s in sentences)
 
+    def test_iter_sentences_matches_parse_sentences(self):
+        """Test that streamed sentences equal the parse_sentences result."""
+        text = """Intro *text*. Second sentence.
+
+<div voice="sarah">
+Sarah speaks ...500ms here.
+
+Another paragraph.
+</div>"""
+        streamed = iter_sentences(text, use_spacy=False, include_default_voice=False)
+
+        assert not isinstance(streamed, list)
+        sentences = list(streamed)
+        expected = parse_sentences(text, use_spacy=False, include_default_voice=False)
+        assert [s.to_ssmd() for s in sentences] == [s.to_ssmd() for s in expected]
+        assert [(s.paragraph_index, s.sentence_index) for s in sentences] == [(1, 2), (2, 3)]
+
 
 class TestParseParagraphs:
     """Test paragraph parsing."""
@@ -2,7 +2,7 @@
 
 import pytest
 
-from ssmd.parser import _merge_nonterminal_fragments, parse_sentences
+from ssmd.parser import _merge_nonterminal_fragments, _split_sentences, parse_sentences
 
 
 class TestPhrasplitAlwaysAvailable:
@@ -29,6 +29,13 @@ def test_heading_marker_fragment_does_not_swallow_following_text():
     assert _merge_nonterminal_fragments(fragments) == ["# Heading", "Hello *world*!\n"]
 
 
+def test_markup_around_annotation_is_fully_restored():
+    """Placeholders nested inside protected markup spans are restored too."""
+    text = 'Hi *[a]{lang="fr"} b* there. Next one.'
+
+    assert list(_split_sentences(text)) == ['Hi *[a]{lang="fr"} b* there.\n', "Next one."]
+
+
 class TestParseSentencesRegexMode:
     """Test sentence parsing with regex mode (use_spacy=False)."""
 
@@ -4,7 +4,7 @@ import phrasplit
 import pytest
 
 from ssmd.document import Document
-from ssmd.parser import parse_paragraphs, parse_sentences
+from ssmd.parser import iter_sentences, parse_paragraphs, parse_sentences
 
 
 def _fake_resolution(*, language: str, model: str | None, size: str | None):
@@ -133,3 +133,47 @@ def test_document_uses_one_exact_configuration_for_sentence_and_paragraph_paths(
     assert all(call["language_model"] == "en_core_web_sm" for call in splitter_calls)
     assert all(call["model_size"] == "lg" for call in splitter_calls)
     assert document.sentence_detection_diagnostics.selected_model == "en_core_web_sm"
+
+
+def test_multi_paragraph_parse_resolves_model_once(monkeypatch):
+    resolver_calls, splitter_calls = _patch_phrasplit(monkeypatch)
+
+    paragraphs = parse_paragraphs("Hello.\n\nWorld.\n\nAgain.", language="en")
+
+    assert len(resolver_calls) == 1
+    assert len(splitter_calls) == 3
+    assert [p.sentences[0].text for p in paragraphs] == ["Hello.", "World.", "Again."]
+
+
+def test_regex_mode_skips_splitter_for_unpunctuated_paragraphs(monkeypatch):
+    _, splitter_calls = _patch_phrasplit(monkeypatch)
+
+    paragraphs = parse_paragraphs("Hello world\n\nSecond line.", use_spacy=False)
+
+    assert len(splitter_calls) == 1
+    assert [p.sentences[0].text for p in paragraphs] == ["Hello world", "Second line."]
+
+
+def test_iter_sentences_resolves_once_and_splits_paragraphs_lazily(monkeypatch):
+    resolver_calls, splitter_calls = _patch_phrasplit(monkeypatch)
+
+    sentences = iter_sentences("Hello.\n\nWorld.\n\nAgain.", language="en")
+    first = next(sentences)
+
+    assert first.text == "Hello."
+    assert len(resolver_calls) == 1
+    assert len(splitter_calls) == 1
+    assert [s.text for s in sentences] == ["World.", "Again."]
+    assert len(resolver_calls) == 1
+    assert len(splitter_calls) == 3
+
+
+def test_repeated_paragraphs_are_split_once_per_parse(monkeypatch):
+    _, splitter_calls = _patch_phrasplit(monkeypatch)
+
+    paragraphs = parse_paragraphs("Chorus.\n\nVerse.\n\nChorus.", language="en")
+    parse_paragraphs("Chorus.", language="en")
+
+    assert len(splitter_calls) == 3
+    assert [p.sentences[0].text for p in paragraphs] == ["Chorus.", "Verse.", "Chorus."]
+    assert paragraphs[0].sentences[0] is not paragraphs[2].sentences[0]